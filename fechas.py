@@ -1,34 +1,94 @@
 """Puente de fechas para el IDE.
 
-Ofrece utilidades mínimas compatibles con la app.
+Ofrece utilidades mínimas compatibles con la app. Las fechas se leen con
+`date_parser`, el mismo parser que usa el tablero de tareas.
+
+Los días faltantes se cuentan por fecha de calendario contra un único "hoy":
+una tarea que vence hoy da 0 (HOY) a cualquier hora. `estados_por_lote` calcula
+los de muchas tareas de una vez, con NumPy si está instalado.
 """
 from __future__ import annotations
-from datetime import datetime
+import sys
+from datetime import date
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from date_parser import parse_fecha
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).resolve().parent / "src"))
+    from date_parser import parse_fecha
 
+DIAS_PRONTO = 3
 
-def dias_faltantes(fecha_texto: str) -> int:
-    try:
-        dd, mm, aaaa = fecha_texto.replace('-', '/').split('/')
-        dt = datetime(int(aaaa), int(mm), int(dd))
-    except Exception:
+
+def dias_faltantes(fecha_texto: str, hoy: date | None = None) -> int:
+    fecha = parse_fecha(fecha_texto)
+    if fecha is None:
         return 0
-    return (dt - datetime.now()).days
+    return (fecha - (hoy or date.today())).days
 
 
-def estado_por_dias(fecha_texto: str) -> str:
-    d = dias_faltantes(fecha_texto)
+def _estado(d: int) -> str:
     if d < 0:
         return 'VENCIDO'
     if d == 0:
         return 'HOY'
-    if d <= 3:
+    if d <= DIAS_PRONTO:
         return 'PRONTO'
     return 'A TIEMPO'
 
 
+def estado_por_dias(fecha_texto: str, hoy: date | None = None) -> str:
+    return _estado(dias_faltantes(fecha_texto, hoy))
+
+
+def estados_por_lote(fechas, hoy: date | None = None, usar_numpy: bool = True):
+    """Días faltantes y estado de cada fecha, todos contra el mismo `hoy`.
+
+    `fechas` puede mezclar `date`, textos y None. Devuelve `(dias, estados)`
+    en el mismo orden: arreglos de NumPy si está disponible, listas si no.
+    Las fechas vacías o ilegibles dan 0 días y estado "".
+    """
+    hoy = hoy or date.today()
+    leidas = [f if isinstance(f, date) else parse_fecha(f) for f in fechas]
+    if np is not None and usar_numpy:
+        return _estados_numpy(leidas, hoy)
+
+    dias, estados = [], []
+    for fecha in leidas:
+        if fecha is None:
+            dias.append(0)
+            estados.append("")
+        else:
+            d = (fecha - hoy).days
+            dias.append(d)
+            estados.append(_estado(d))
+    return dias, estados
+
+
+def _estados_numpy(leidas: list[date | None], hoy: date):
+    # Convertir cada date a datetime64 desde Python es lento: se pasan los
+    # ordinales (días desde el 01/01/0001) y se opera sobre días enteros.
+    ordinales = np.fromiter(
+        (f.toordinal() if f is not None else 0 for f in leidas), dtype=np.int64, count=len(leidas)
+    )
+    validas = ordinales > 0
+    dias = np.where(validas, ordinales - hoy.toordinal(), 0)
+    estados = np.select(
+        [~validas, dias < 0, dias == 0, dias <= DIAS_PRONTO],
+        ["", "VENCIDO", "HOY", "PRONTO"],
+        default="A TIEMPO",
+    )
+    return dias, estados
+
+
 def formatear_fecha(fecha_texto: str) -> str:
-    try:
-        dd, mm, aaaa = fecha_texto.replace('-', '/').split('/')
-        return f"{int(dd):02d}/{int(mm):02d}/{int(aaaa):04d}"
-    except Exception:
+    fecha = parse_fecha(fecha_texto)
+    if fecha is None:
         return fecha_texto
+    return f"{fecha.day:02d}/{fecha.month:02d}/{fecha.year:04d}"
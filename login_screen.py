@@ -1,16 +1,19 @@
 
 import tkinter as tk
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 from tkinter import font as tkfont
 from tkinter import messagebox
 import sys
 import importlib.util
+import multiprocessing
+from functools import lru_cache
 
 try:
-    from PIL import Image, ImageTk
+    from PIL import Image, ImageDraw, ImageTk
 except ImportError:
     Image = None
+    ImageDraw = None
     ImageTk = None
 
 
@@ -58,13 +61,13 @@ except Exception:
         return any(c.isalpha() for c in contrasena) and any(c.isdigit() for c in contrasena)
 
 try:
-    from fechas import formatear_fecha, estado_por_dias
+    from fechas import formatear_fecha, estados_por_lote
 except Exception:
     def formatear_fecha(fecha_texto: str) -> str:
         return fecha_texto
 
-    def estado_por_dias(fecha_texto: str) -> str:
-        return ""
+    def estados_por_lote(fechas, hoy=None):
+        return [0] * len(fechas), [""] * len(fechas)
 
 try:
     from mensajes import (
@@ -82,9 +85,19 @@ except Exception:
     def mostrar_mensaje_info(texto: str) -> str:
         return texto
 
-from auth_service import login as auth_login, registrar_usuario
-from task_service import listar_tareas, agregar_tarea, actualizar_tarea
-from db import get_conn
+from auth_service import cargar_hasher_guardado, login_async as auth_login_async, registrar_usuario
+from mensajes_adapter import t as service_message
+from task_service import (
+    listar_tareas,
+    listar_tareas_seccion,
+    contar_tareas_por_seccion,
+    agregar_tarea,
+    actualizar_tarea,
+)
+from date_parser import parse_fecha
+from workers import TkExecutor
+from scheduler import ReminderScheduler
+from notify_task import NotificationQueue
 
 
 
@@ -102,6 +115,8 @@ FIELD_X = 152
 FIELD_WIDTH = 960
 FIELD_HEIGHT = 75
 FIELD_RADIUS = 30
+PANEL_SHADOW_WIDTH = 90
+PANEL_SHADOW_ALPHA = 0.25
 
 
 LOGIN_FIRST_FIELD_Y = 463
@@ -142,7 +157,13 @@ TASK_CARD_WIDTH = 485
 TASK_CARD_HEIGHT = 109
 TASK_CARD_STRIPE_WIDTH = 31
 TASK_CARD_RADIUS = 15
+TASK_CARD_PILL_X = TASK_CARD_WIDTH - 130
+TASK_CARD_PILL_Y = 10
+TASK_CARD_PILL_WIDTH = 92
+TASK_CARD_PILL_HEIGHT = 20
 TASK_ROW_GAP = 40
+TASK_PAGE_SIZE = 60
+TASK_OVERSCAN_ROWS = 2
 SECTION_FIRST_HEADER_Y = 150
 SECTION_HEADER_TO_CARDS = 105
 SECTION_LINE_OFFSET = 19
@@ -198,6 +219,52 @@ CARD_PLACEHOLDERS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _hex_to_rgb(value: str) -> tuple[int, int, int]:
+    value = value.lstrip("#")
+    return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+
+@lru_cache(maxsize=4096)
+def blend_colors(foreground: str, background: str, alpha: float) -> str:
+    """Mix `foreground` over `background` at `alpha`; results are memoized."""
+    fg_r, fg_g, fg_b = _hex_to_rgb(foreground)
+    bg_r, bg_g, bg_b = _hex_to_rgb(background)
+    r = round(fg_r * alpha + bg_r * (1 - alpha))
+    g = round(fg_g * alpha + bg_g * (1 - alpha))
+    b = round(fg_b * alpha + bg_b * (1 - alpha))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def blend_gradient(foreground: str, background: str, alphas) -> list[str]:
+    """Blend one color pair at many opacities, parsing both colors only once."""
+    fg_r, fg_g, fg_b = _hex_to_rgb(foreground)
+    bg_r, bg_g, bg_b = _hex_to_rgb(background)
+    dr, dg, db = fg_r - bg_r, fg_g - bg_g, fg_b - bg_b
+    return [
+        f"#{round(bg_r + dr * alpha):02x}{round(bg_g + dg * alpha):02x}{round(bg_b + db * alpha):02x}"
+        for alpha in alphas
+    ]
+
+
+# (color, opacity) pairs that the screens blend against the background on every
+# redraw: cards, modal buttons, nav blocks/indicators and dashboard tiles.
+PALETTE_BLENDS = (
+    (WHITE, 0.85),
+    (WHITE, 0.6),
+    (WHITE, 0.65),
+    (WHITE, 0.7),
+    (WHITE, 0.15),
+    (WHITE, 0.50),
+    (BACKGROUND_COLOR, 0.5),
+    (SECONDARY_COLOR, 1.0),
+    (SECONDARY_COLOR, 0.4),
+    ("#F4F7F6", 0.10),
+)
+for _color, _alpha in PALETTE_BLENDS:
+    blend_colors(_color, BACKGROUND_COLOR, _alpha)
+
+
 class LoginScreen(tk.Tk):
     """Main window that can toggle between login and register mockups with pixel-perfect scaling."""
 
@@ -241,18 +308,28 @@ class LoginScreen(tk.Tk):
         self.current_screen = "login"
         self.chevron_photo = self._load_chevron_image()
         self.image_cache: dict[tuple[str, int, int], tk.PhotoImage] = {}
+        self.sprite_cache: dict[tuple, tk.PhotoImage] = {}
+        self.use_card_sprites = True
+        self.use_shadow_image = True
+        self.shadow_colors: list[str] | None = None
         self.active_images: list[tk.PhotoImage] = []
         self.pending_email: str | None = None
         self.logged_in_user: dict[str, str] | None = None
         self.dashboard_tasks: list[dict] = []
         self.task_list_items: list[int] = []
         self.tasks_list_origin: tuple[float, float] | None = None
+        self.task_board: dict | None = None
         self.tasks_error_item: int | None = None
         self.login_error_item: int | None = None
         self.register_error_item: int | None = None
         self.task_modal_window: tk.Toplevel | None = None
         self.task_modal_overlay: tk.Toplevel | None = None
         self.task_modal_context: dict | None = None
+        self._date_picker: tk.Toplevel | None = None
+        self.executor = TkExecutor(self)
+        self.login_busy = False
+        self.register_busy = False
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
 
         self.show_login_screen()
 
@@ -369,6 +446,10 @@ class LoginScreen(tk.Tk):
     def _clear_screen(self):
         if getattr(self, "task_modal_window", None):
             self._close_task_modal(save=False)
+        self.executor.cancel("screen")
+        self.executor.cancel("board")
+        self.login_busy = False
+        self.register_busy = False
         self.canvas.delete("all")
         for widget in self.overlay_widgets:
             widget.destroy()
@@ -376,6 +457,7 @@ class LoginScreen(tk.Tk):
         self.active_images = []
         self.task_list_items = []
         self.tasks_list_origin = None
+        self.task_board = None
         self.login_error_item = None
         self.register_error_item = None
         self.tasks_error_item = None
@@ -400,17 +482,54 @@ class LoginScreen(tk.Tk):
         )
 
     def _draw_panel_shadow(self):
-        shadow_width = 90
-        max_alpha = 0.25
+        image = self._panel_shadow_image() if self.use_shadow_image else None
+        if image:
+            self.canvas.create_image(
+                self.sx(PANEL_X - PANEL_SHADOW_WIDTH),
+                self.sy(0),
+                image=image,
+                anchor="nw",
+            )
+            return
         top = self.sy(0)
         bottom = self.sy(DESIGN_HEIGHT)
-        for index in range(shadow_width):
-            fade = 1 - (index / shadow_width)
-            blended = self._blend_colors("#000000", BACKGROUND_COLOR, max_alpha * fade)
+        for index, blended in enumerate(self._panel_shadow_colors()):
             x0 = self.sx(PANEL_X - index - 1)
             x1 = self.sx(PANEL_X - index)
             self.canvas.create_rectangle(x0, top, x1, bottom, fill=blended, outline="")
 
+    def _panel_shadow_colors(self) -> list[str]:
+        """Shadow color for each design column left of the panel (index 0 is the darkest)."""
+        if self.shadow_colors is None:
+            self.shadow_colors = blend_gradient(
+                "#000000",
+                BACKGROUND_COLOR,
+                [PANEL_SHADOW_ALPHA * (1 - index / PANEL_SHADOW_WIDTH) for index in range(PANEL_SHADOW_WIDTH)],
+            )
+        return self.shadow_colors
+
+    def _panel_shadow_image(self):
+        """The whole shadow gradient as one PhotoImage, built once per (scale, height)."""
+        width = max(1, int(round(self.sw(PANEL_SHADOW_WIDTH))))
+        height = max(1, int(round(self.sh(DESIGN_HEIGHT))))
+        cache_key = ("panel-shadow", self.scale, height)
+        if cache_key in self.image_cache:
+            return self.image_cache[cache_key]
+
+        colors = self._panel_shadow_colors()
+        row = []
+        for pixel in range(width):
+            index = int(PANEL_SHADOW_WIDTH - (pixel + 0.5) / self.scale)
+            row.append(colors[min(PANEL_SHADOW_WIDTH - 1, max(0, index))])
+        try:
+            photo = tk.PhotoImage(width=width, height=height)
+            # A single row of pixels; Tk tiles it down the whole image.
+            photo.put("{" + " ".join(row) + "}", to=(0, 0, width, height))
+        except tk.TclError:
+            photo = None
+        self.image_cache[cache_key] = photo
+        return photo
+
     def _rounded_rect(self, x, y, width, height, radius, **kwargs):
         x1, y1 = x, y
         x2, y2 = x + width, y + height
@@ -508,57 +627,44 @@ class LoginScreen(tk.Tk):
 
     @staticmethod
     def _blend_colors(foreground, background, alpha):
-        def hex_to_rgb(value):
-            value = value.lstrip("#")
-            return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
-
-        fg_r, fg_g, fg_b = hex_to_rgb(foreground)
-        bg_r, bg_g, bg_b = hex_to_rgb(background)
-        r = round(fg_r * alpha + bg_r * (1 - alpha))
-        g = round(fg_g * alpha + bg_g * (1 - alpha))
-        b = round(fg_b * alpha + bg_b * (1 - alpha))
-        return f"#{r:02x}{g:02x}{b:02x}"
+        return blend_colors(foreground, background, alpha)
 
     def _apply_opacity(self, hex_color: str, alpha: float) -> str:
         """Blend the given color against the background using the provided opacity."""
         alpha = max(0.0, min(1.0, alpha))
-        return self._blend_colors(hex_color, BACKGROUND_COLOR, alpha)
-
-    def _load_user_profile(self, email: str) -> dict[str, str] | None:
-        correo = email.strip().lower()
-        try:
-            with get_conn() as con:
-                row = con.execute(
-                    "SELECT id, correo, nombre FROM usuarios WHERE correo=?",
-                    (correo,),
-                ).fetchone()
-            if not row:
-                return None
-            name = row["nombre"] or correo.split("@", 1)[0].title()
-            return {"id": row["id"], "email": row["correo"], "name": name}
-        except Exception as exc:
-            print("Error cargando el perfil:", exc)
-            return None
-
-    def _prepare_dashboard_data(self):
-        if not self.logged_in_user:
-            self.dashboard_tasks = []
-            return
+        return blend_colors(hex_color, BACKGROUND_COLOR, alpha)
 
-        correo = self.logged_in_user["email"]
-        tasks = []
+    def _load_dashboard_tasks(self, user_id: int) -> list[dict]:
+        """Runs on a worker thread: must not touch Tk."""
         try:
-            for row in listar_tareas(correo):
-                record = dict(row)
-                fecha = record.get("fecha", "")
-                record["fecha_formateada"] = formatear_fecha(fecha) if fecha else ""
-                estado = estado_por_dias(fecha) if fecha else ""
-                record["estado"] = estado
-                tasks.append(record)
+            tasks = [dict(row) for row in listar_tareas(user_id)]
         except Exception as exc:
             print("Error listando tareas:", exc)
-            tasks = []
-        self.dashboard_tasks = tasks
+            return []
+        _days, statuses = estados_por_lote(
+            [record.get("due_date") or record.get("fecha") for record in tasks], date.today()
+        )
+        for record, status in zip(tasks, statuses):
+            # Text and status come from the same date: due_date already carries
+            # the year a DD/MM task was created in.
+            fecha = record.get("due_date") or record.get("fecha", "")
+            record["fecha_formateada"] = formatear_fecha(fecha) if fecha else ""
+            record["estado"] = str(status)
+        return tasks
+
+    def _on_close(self):
+        self.executor.shutdown()
+        self.destroy()
+
+    def _draw_loading_text(self, tag: str):
+        self.canvas.create_text(
+            self.sx(DESIGN_WIDTH / 2),
+            self.sy(DESIGN_HEIGHT / 2),
+            text="Cargando...",
+            fill=PRIMARY_TEXT_COLOR,
+            font=self._font(32),
+            tags=(tag,),
+        )
 
     def _logout(self):
         self.logged_in_user = None
@@ -589,7 +695,21 @@ class LoginScreen(tk.Tk):
         self.current_screen = "dashboard"
         self._clear_screen()
         self.canvas.configure(bg=BACKGROUND_COLOR)
-        self._prepare_dashboard_data()
+        if not self.logged_in_user:
+            self.dashboard_tasks = []
+            self._draw_dashboard_ui()
+            return
+        self._draw_loading_text("screen-loading")
+        self.executor.submit(
+            "screen",
+            self._load_dashboard_tasks,
+            self.logged_in_user["id"],
+            on_done=self._on_dashboard_loaded,
+        )
+
+    def _on_dashboard_loaded(self, tasks: list[dict]):
+        self.dashboard_tasks = tasks
+        self.canvas.delete("screen-loading")
         self._draw_dashboard_ui()
 
 
@@ -599,7 +719,6 @@ class LoginScreen(tk.Tk):
         self.current_screen = "tasks"
         self._clear_screen()
         self.canvas.configure(bg=BACKGROUND_COLOR)
-        self._prepare_dashboard_data()
         self._draw_tasks_ui()
 
     def _draw_tasks_ui(self):
@@ -642,63 +761,292 @@ class LoginScreen(tk.Tk):
         )
         self._bind_click([plus_item], lambda: self._open_task_modal(None))
 
-        sections = self._build_task_sections()
-
-        current_header_y = SECTION_FIRST_HEADER_Y
-
+        self.task_board = {
+            "sections": {},
+            "cards": {},
+            "pool": [],
+            "groups": 0,
+            "counts": {},
+            "loaded": {},
+            "stale": {},
+            "exhausted": {},
+            "nav_top": None,
+            "today": date.today(),
+            "fetching": set(),
+        }
+        # Until the counts arrive each section gets one row of height, with a
+        # loading note where its cards will go; _layout_task_board then moves
+        # the headers to their real places.
+        header_y = SECTION_FIRST_HEADER_Y
         for config in TASK_SECTION_CONFIG:
+            self._draw_section_header(config, header_y)
             self.canvas.create_text(
                 self.sx(152),
-                self.sy(current_header_y),
-                text=config["label"],
-                fill=PRIMARY_TEXT_COLOR,
-                font=self._font(64),
-                anchor="nw",
-            )
-            line_y = current_header_y + SECTION_LINE_OFFSET
-            self.canvas.create_line(
-                self.sx(560),
-                self.sy(line_y),
-                self.sx(560 + 1031),
-                self.sy(line_y),
+                self.sy(header_y + SECTION_HEADER_TO_CARDS),
+                text="Cargando...",
                 fill="#3C3D37",
-                width=max(1.0, self.scale),
+                font=self._font(24),
+                anchor="nw",
+                tags=("board-loading",),
             )
+            header_y += SECTION_HEADER_TO_CARDS + TASK_CARD_HEIGHT + SECTION_AFTER_CARDS_GAP
+        self._sync_task_board()
 
-            tasks = sections.get(config["key"], [])
-            cards_y = current_header_y + SECTION_HEADER_TO_CARDS
-            if not tasks:
-                self.canvas.create_text(
+    def _draw_section_header(self, config: dict, header_y: float):
+        tag = f"section-{config['key']}"
+        self.canvas.create_text(
+            self.sx(152),
+            self.sy(header_y),
+            text=config["label"],
+            fill=PRIMARY_TEXT_COLOR,
+            font=self._font(64),
+            anchor="nw",
+            tags=(tag,),
+        )
+        line_y = header_y + SECTION_LINE_OFFSET
+        self.canvas.create_line(
+            self.sx(560),
+            self.sy(line_y),
+            self.sx(560 + 1031),
+            self.sy(line_y),
+            fill="#3C3D37",
+            width=max(1.0, self.scale),
+            tags=(tag,),
+        )
+        self.task_board["sections"][config["key"]] = {"top": header_y, "ids": [], "empty_item": None}
+
+    @staticmethod
+    def _card_slot(cards_y: float, index: int) -> tuple[float, float]:
+        col = index % len(TASK_CARD_X_POSITIONS)
+        row = index // len(TASK_CARD_X_POSITIONS)
+        return TASK_CARD_X_POSITIONS[col], cards_y + row * (TASK_CARD_HEIGHT + TASK_ROW_GAP)
+
+    @staticmethod
+    def _card_signature(task: dict) -> tuple:
+        return task.get("title"), task.get("date"), task.get("status")
+
+    def _sync_task_board(self):
+        """Reload section sizes in the background, then lay the board out again.
+
+        Page fetches still in flight belong to the previous layout, so they are
+        cancelled; the cards on screen stay until each section's new first page
+        arrives, and only the cards that changed are touched then.
+        """
+        if not self.logged_in_user:
+            self._layout_task_board({})
+            return
+        today = date.today()
+        self.executor.cancel("board")
+        self.task_board["fetching"] = set()
+        self.executor.submit(
+            "board",
+            self._load_section_counts,
+            self.logged_in_user["id"],
+            today,
+            on_done=lambda counts: self._layout_task_board(counts, today),
+        )
+
+    def _layout_task_board(self, counts: dict[str, int], today: date | None = None):
+        """Move section headers and the bottom nav to fit `counts` and redraw the visible cards.
+
+        Headers and nav are moved as a block when a section above them grew or
+        shrank; cards are handled by _render_visible_cards.
+        """
+        board = self.task_board
+        if board is None:
+            return
+        self.canvas.delete("board-loading")
+        board["today"] = today or date.today()
+        board["counts"] = counts
+        # The previous pages stay on screen (and keep their cards) until the
+        # first page of the new layout arrives for that section; then the cards
+        # are diffed by task id, so only the ones that changed are touched.
+        stale = board["stale"]
+        board["stale"] = {
+            key: (stale.get(key) if stale.get(key) is not None else board["loaded"].get(key) or None)
+            if counts.get(key) else None
+            for key in (config["key"] for config in TASK_SECTION_CONFIG)
+        }
+        board["loaded"] = {config["key"]: [] for config in TASK_SECTION_CONFIG}
+        board["exhausted"] = {config["key"]: False for config in TASK_SECTION_CONFIG}
+        columns = len(TASK_CARD_X_POSITIONS)
+        header_y = SECTION_FIRST_HEADER_Y
+
+        for config in TASK_SECTION_CONFIG:
+            key = config["key"]
+            state = board["sections"][key]
+            section_tag = f"section-{key}"
+            shift = header_y - state["top"]
+            if shift:
+                self.canvas.move(section_tag, 0, self.sh(shift))
+                state["top"] = header_y
+            cards_y = header_y + SECTION_HEADER_TO_CARDS
+            count = board["counts"].get(key, 0)
+
+            if not count and state["empty_item"] is None:
+                state["empty_item"] = self.canvas.create_text(
                     self.sx(152),
                     self.sy(cards_y),
                     text="Sin tareas registradas en esta seccion.",
                     fill="#3C3D37",
                     font=self._font(24),
                     anchor="nw",
+                    tags=(section_tag,),
                 )
-                rows_drawn = 1
-            else:
-                for index, task in enumerate(tasks):
-                    col = index % len(TASK_CARD_X_POSITIONS)
-                    row = index // len(TASK_CARD_X_POSITIONS)
-                    card_x = TASK_CARD_X_POSITIONS[col]
-                    card_y = cards_y + row * (TASK_CARD_HEIGHT + TASK_ROW_GAP)
-                    task_payload = dict(task)
-                    card_items = self._draw_task_card(card_x, card_y, task_payload)
-                    self._bind_click(card_items, lambda data=task_payload: self._open_task_modal(dict(data)))
-                rows_drawn = (len(tasks) + len(TASK_CARD_X_POSITIONS) - 1) // len(TASK_CARD_X_POSITIONS)
+            elif count and state["empty_item"] is not None:
+                self.canvas.delete(state["empty_item"])
+                state["empty_item"] = None
 
+            rows_drawn = max(1, (count + columns - 1) // columns)
             total_cards_height = rows_drawn * TASK_CARD_HEIGHT + max(0, rows_drawn - 1) * TASK_ROW_GAP
-            current_header_y = cards_y + total_cards_height + SECTION_AFTER_CARDS_GAP
-
-        nav_top = max(903, current_header_y)
-        self._draw_bottom_navigation(nav_top)
+            header_y = cards_y + total_cards_height + SECTION_AFTER_CARDS_GAP
+
+        nav_top = max(903, header_y)
+        if board["nav_top"] is None:
+            self._draw_bottom_navigation(nav_top, tags=("board-nav",))
+        elif nav_top != board["nav_top"]:
+            self.canvas.move("board-nav", 0, self.sh(nav_top - board["nav_top"]))
+        board["nav_top"] = nav_top
         try:
-            self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+            nav_box = self.canvas.bbox("board-nav")
+            bottom = max(self.window_height, nav_box[3] if nav_box else 0)
+            self.canvas.configure(scrollregion=(0, 0, self.window_width, bottom))
         except Exception:
             pass
+        self._render_visible_cards()
 
-    def _draw_bottom_navigation(self, base_y: float):
+    @staticmethod
+    def _load_section_counts(user_id: int, today: date) -> dict[str, int]:
+        """Runs on a worker thread: must not touch Tk."""
+        try:
+            return contar_tareas_por_seccion(user_id, today)
+        except Exception as exc:
+            print("Error listando tareas:", exc)
+            return {}
+
+    def _load_section_page(self, user_id: int, key: str, today: date, limit: int, after) -> list[dict]:
+        """Runs on a worker thread: must not touch Tk."""
+        try:
+            rows = listar_tareas_seccion(user_id, key, today, limite=limit, despues_de=after)
+        except Exception as exc:
+            print("Error listando tareas:", exc)
+            return []
+        return [self._task_entry(dict(row)) for row in rows]
+
+    def _ensure_section_loaded(self, key: str, upto: int) -> list[dict]:
+        """Return the tasks of a section loaded so far.
+
+        When fewer than `upto` are loaded, the next page is fetched in the
+        background (one request per section at a time) and the visible cards
+        are drawn again once it arrives.
+        """
+        board = self.task_board
+        loaded = board["loaded"][key]
+        if len(loaded) >= upto or board["exhausted"][key] or key in board["fetching"]:
+            return loaded
+        wanted = max(TASK_PAGE_SIZE, upto - len(loaded))
+        after = (loaded[-1]["raw"].get("due_date"), loaded[-1]["id"]) if loaded else None
+
+        def on_page(entries: list[dict]):
+            if self.task_board is not board or board["loaded"][key] is not loaded:
+                return
+            board["fetching"].discard(key)
+            board["stale"][key] = None
+            loaded.extend(entries)
+            if len(entries) < wanted:
+                board["exhausted"][key] = True
+            self._render_visible_cards()
+
+        board["fetching"].add(key)
+        self.executor.submit(
+            "board",
+            self._load_section_page,
+            self.logged_in_user["id"],
+            key,
+            board["today"],
+            wanted,
+            after,
+            on_done=on_page,
+        )
+        return loaded
+
+    def _visible_design_range(self) -> tuple[float, float]:
+        top = self.canvas.canvasy(0)
+        bottom = self.canvas.canvasy(self.canvas.winfo_height())
+        return (top - self.offset_y) / self.scale, (bottom - self.offset_y) / self.scale
+
+    def _render_visible_cards(self):
+        """Draw only the card rows inside the viewport (plus overscan).
+
+        Each task id maps to a card group (the canvas items of one card). Groups
+        that scroll out of view are hidden and kept in a pool; new rows reuse
+        them by moving and restyling instead of creating items.
+        """
+        board = self.task_board
+        if board is None:
+            return
+        view_top, view_bottom = self._visible_design_range()
+        pitch = TASK_CARD_HEIGHT + TASK_ROW_GAP
+        columns = len(TASK_CARD_X_POSITIONS)
+        wanted: dict = {}
+
+        for config in TASK_SECTION_CONFIG:
+            key = config["key"]
+            count = board["counts"].get(key, 0)
+            if not count:
+                continue
+            cards_y = board["sections"][key]["top"] + SECTION_HEADER_TO_CARDS
+            total_rows = (count + columns - 1) // columns
+            first_row = max(0, int((view_top - cards_y) // pitch) - TASK_OVERSCAN_ROWS)
+            last_row = min(total_rows - 1, int((view_bottom - cards_y) // pitch) + TASK_OVERSCAN_ROWS)
+            if last_row < first_row:
+                continue
+            loaded = self._ensure_section_loaded(key, min(count, (last_row + 1) * columns))
+            if board["stale"].get(key) is not None:
+                loaded = board["stale"][key]
+            for index in range(first_row * columns, min(len(loaded), count, (last_row + 1) * columns)):
+                task = loaded[index]
+                wanted[task["id"]] = (self._card_slot(cards_y, index), task)
+
+        cards = board["cards"]
+        pool = board["pool"]
+        for task_id in [task_id for task_id in cards if task_id not in wanted]:
+            group = cards.pop(task_id)
+            self.canvas.itemconfigure(group["tag"], state="hidden")
+            pool.append(group)
+
+        for task_id, (slot, task) in wanted.items():
+            group = cards.get(task_id)
+            if group is None:
+                group = pool.pop() if pool else self._create_card_group(slot)
+                self.canvas.itemconfigure(group["tag"], state="normal")
+                cards[task_id] = group
+            if group["signature"] != self._card_signature(task):
+                self._restyle_card_group(group, task)
+            group["task"] = task
+            if group["origin"] != slot:
+                self.canvas.move(
+                    group["tag"],
+                    self.sw(slot[0] - group["origin"][0]),
+                    self.sh(slot[1] - group["origin"][1]),
+                )
+                group["origin"] = slot
+
+    def _create_card_group(self, slot: tuple[float, float]) -> dict:
+        board = self.task_board
+        board["groups"] += 1
+        tag = f"card-group-{board['groups']}"
+        items = self._draw_task_card(slot[0], slot[1], {}, tags=(tag,))
+        group = {"tag": tag, "items": items, "origin": slot, "signature": None, "task": None}
+
+        def open_card():
+            if group["task"]:
+                self._open_task_modal(dict(group["task"]))
+
+        self._bind_click([tag], open_card)
+        return group
+
+    def _draw_bottom_navigation(self, base_y: float, tags: tuple = ()):
 
 
         nav_specs = [
@@ -727,6 +1075,7 @@ class LoginScreen(tk.Tk):
                 self.sw(30),
                 fill=background_color,
                 outline="",
+                tags=tags,
             )
             text_color = PRIMARY_TEXT_COLOR if spec["active"] else "#3C3D37"
             self.canvas.create_text(
@@ -736,6 +1085,7 @@ class LoginScreen(tk.Tk):
                 fill=text_color,
                 font=self._font(30),
                 anchor="n",
+                tags=tags,
             )
             indicator_color = self._apply_opacity(SECONDARY_COLOR, 1.0 if spec["active"] else 0.4)
             self._rounded_rect(
@@ -746,6 +1096,7 @@ class LoginScreen(tk.Tk):
                 self.sw(indicator_height / 2),
                 fill=indicator_color,
                 outline="",
+                tags=tags,
             )
 
     def _on_mouse_wheel(self, event):
@@ -757,6 +1108,8 @@ class LoginScreen(tk.Tk):
             self.canvas.yview_scroll(units, 'units')
         except Exception:
             pass
+        if self.current_screen == "tasks":
+            self._render_visible_cards()
 
 
     def _compute_card_height(self, title: str) -> int:
@@ -770,62 +1123,67 @@ class LoginScreen(tk.Tk):
             return int(TASK_CARD_HEIGHT + extra * (linespace))
         except Exception:
             return TASK_CARD_HEIGHT
-    def _build_task_sections(self) -> dict[str, list[dict]]:
-        sections: dict[str, list[dict]] = {config["key"]: [] for config in TASK_SECTION_CONFIG}
-        today = date.today()
-
-        for record in self.dashboard_tasks:
-            due_date = self._parse_due_date(record.get("fecha"))
-            status = "done" if bool(record.get("done")) else "pending"
-            entry = {
-                "id": record.get("id"),
-                "title": str(record.get("texto", "")).strip() or "Sin titulo",
-                "date": record.get("fecha") or "",
-                "status": status,
-                "placeholder": False,
-                "raw": record,
-                "due": due_date,
-            }
-            if due_date is None:
-                bucket = "future"
-            elif due_date < today:
-                bucket = "past"
-            elif due_date == today:
-                bucket = "current"
-            else:
-                bucket = "future"
-            sections[bucket].append(entry)
 
-        for key, items in sections.items():
-            if key == "past":
-                items.sort(key=lambda item: item["due"] or date.min, reverse=True)
-            else:
-                items.sort(key=lambda item: (item["due"] or date.max, item["title"]))
-        return sections
+    def _task_entry(self, record: dict) -> dict:
+        due_iso = record.get("due_date")
+        return {
+            "id": record.get("id"),
+            "title": str(record.get("texto", "")).strip() or "Sin titulo",
+            "date": record.get("fecha") or "",
+            "status": "done" if bool(record.get("done")) else "pending",
+            "placeholder": False,
+            "raw": record,
+            "due": date.fromisoformat(due_iso) if due_iso else None,
+        }
 
     def _parse_due_date(self, value: str | None) -> date | None:
-        if not value:
-            return None
-        text = str(value).strip()
-        if not text:
-            return None
-        candidates = [text]
-        if len(text) == 5 and "/" in text:
-            candidates.append(f"{text}/{date.today().year}")
-        for candidate in candidates:
-            for fmt in ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%y"):
-                try:
-                    return datetime.strptime(candidate, fmt).date()
-                except ValueError:
-                    continue
-        return None
+        return parse_fecha(value)
 
-    def _draw_task_card(self, x: float, y: float, task: dict) -> list[int]:
+    def _draw_task_card(self, x: float, y: float, task: dict, tags: tuple = ()) -> list[int]:
         is_placeholder = task.get("placeholder", False)
         status_key = task.get("status", "pending")
         status_style = TASK_STATUS_STYLES.get(status_key, TASK_STATUS_STYLES["pending"])
         card_opacity = 0.85 if not is_placeholder else 0.6
 
+        sprite = self._card_sprite(status_style, card_opacity)
+        if sprite:
+            items = [self.canvas.create_image(self.sx(x), self.sy(y), image=sprite, anchor="nw", tags=tags)]
+        else:
+            items = self._draw_card_shapes(x, y, status_style, card_opacity, tags)
+
+        date_text = self.canvas.create_text(
+            self.sx(x + 62),
+            self.sy(y + 16),
+            text=task.get("date", ""),
+            fill=PRIMARY_TEXT_COLOR,
+            font=self._font(15),
+            anchor="nw",
+            tags=tags,
+        )
+        title_text = self.canvas.create_text(
+            self.sx(x + 62),
+            self.sy(y + 54),
+            text=task.get("title", ""),
+            fill=PRIMARY_TEXT_COLOR,
+            font=self._font(30),
+            anchor="nw",
+            width=self.sw(TASK_CARD_WIDTH - 160),
+            tags=tags,
+        )
+        pill_text = self.canvas.create_text(
+            self.sx(x + TASK_CARD_PILL_X + TASK_CARD_PILL_WIDTH / 2),
+            self.sy(y + TASK_CARD_PILL_Y + TASK_CARD_PILL_HEIGHT / 2),
+            text=status_style["label"],
+            fill=status_style["pill_fg"],
+            font=self._font(12),
+            anchor="center",
+            tags=tags,
+        )
+        items.extend([date_text, title_text, pill_text])
+        return items
+
+    def _draw_card_shapes(self, x: float, y: float, status_style: dict, card_opacity: float, tags: tuple) -> list[int]:
+        """Card background, stripe and pill as canvas shapes (used without Pillow)."""
         items = self._rounded_rect(
             self.sx(x),
             self.sy(y),
@@ -834,9 +1192,9 @@ class LoginScreen(tk.Tk):
             self.sw(TASK_CARD_RADIUS),
             fill=self._apply_opacity(WHITE, card_opacity),
             outline="",
+            tags=tags,
         )
 
-
         radius = TASK_CARD_RADIUS
         stripe_right = self.sx(x + TASK_CARD_STRIPE_WIDTH)
         rect_id = self.canvas.create_rectangle(
@@ -846,6 +1204,7 @@ class LoginScreen(tk.Tk):
             self.sy(y + TASK_CARD_HEIGHT),
             fill=status_style["stripe"],
             outline="",
+            tags=tags,
         )
         rect_mid = self.canvas.create_rectangle(
             self.sx(x),
@@ -854,6 +1213,7 @@ class LoginScreen(tk.Tk):
             self.sy(y + TASK_CARD_HEIGHT - radius),
             fill=status_style["stripe"],
             outline="",
+            tags=tags,
         )
         oval_top = self.canvas.create_oval(
             self.sx(x),
@@ -862,6 +1222,7 @@ class LoginScreen(tk.Tk):
             self.sy(y + 2 * radius),
             fill=status_style["stripe"],
             outline="",
+            tags=tags,
         )
         oval_bottom = self.canvas.create_oval(
             self.sx(x),
@@ -870,50 +1231,73 @@ class LoginScreen(tk.Tk):
             self.sy(y + TASK_CARD_HEIGHT),
             fill=status_style["stripe"],
             outline="",
+            tags=tags,
         )
         items.extend([rect_id, rect_mid, oval_top, oval_bottom])
-        date_text = self.canvas.create_text(
-            self.sx(x + 62),
-            self.sy(y + 16),
-            text=task.get("date", ""),
-            fill=PRIMARY_TEXT_COLOR,
-            font=self._font(15),
-            anchor="nw",
-        )
-        title_text = self.canvas.create_text(
-            self.sx(x + 62),
-            self.sy(y + 54),
-            text=task.get("title", ""),
-            fill=PRIMARY_TEXT_COLOR,
-            font=self._font(30),
-            anchor="nw",
-            width=self.sw(TASK_CARD_WIDTH - 160),
-        )
-        items.extend([date_text, title_text])
-
-        pill_width = 92
-        pill_height = 20
-        pill_x = x + TASK_CARD_WIDTH - 130
-        pill_items = self._rounded_rect(
-            self.sx(pill_x),
-            self.sy(y + 10),
-            self.sw(pill_width),
-            self.sh(pill_height),
-            self.sw(pill_height / 2),
+
+        items.extend(self._rounded_rect(
+            self.sx(x + TASK_CARD_PILL_X),
+            self.sy(y + TASK_CARD_PILL_Y),
+            self.sw(TASK_CARD_PILL_WIDTH),
+            self.sh(TASK_CARD_PILL_HEIGHT),
+            self.sw(TASK_CARD_PILL_HEIGHT / 2),
             fill=status_style["pill_bg"],
             outline="",
-        )
-        pill_text = self.canvas.create_text(
-            self.sx(pill_x + pill_width / 2),
-            self.sy(y + 10 + pill_height / 2),
-            text=status_style["label"],
-            fill=status_style["pill_fg"],
-            font=self._font(12),
-            anchor="center",
-        )
-        items.extend(pill_items + [pill_text])
+            tags=tags,
+        ))
         return items
 
+    def _card_sprite(self, status_style: dict, card_opacity: float):
+        """Card background, stripe and pill pre-rendered once into a PhotoImage.
+
+        Returns None when Pillow is not available (or sprites are disabled),
+        in which case the card is drawn with canvas shapes.
+        """
+        if not (self.use_card_sprites and Image and ImageTk and ImageDraw):
+            return None
+        fill = self._apply_opacity(WHITE, card_opacity)
+        width = max(1, int(round(self.sw(TASK_CARD_WIDTH))))
+        height = max(1, int(round(self.sh(TASK_CARD_HEIGHT))))
+        cache_key = (width, height, TASK_CARD_RADIUS, fill, status_style["stripe"], status_style["pill_bg"], self.scale)
+        if cache_key in self.sprite_cache:
+            return self.sprite_cache[cache_key]
+
+        # Drawn at 4x and scaled down so the rounded corners are antialiased.
+        factor = 4
+        unit = self.scale * factor
+        radius = TASK_CARD_RADIUS * unit
+        image = Image.new("RGBA", (width * factor, height * factor), (0, 0, 0, 0))
+        draw = ImageDraw.Draw(image)
+        draw.rounded_rectangle((0, 0, width * factor - 1, height * factor - 1), radius=radius, fill=fill)
+        draw.rounded_rectangle((0, 0, 2 * radius, height * factor - 1), radius=radius, fill=status_style["stripe"])
+        draw.rectangle((radius, 0, TASK_CARD_STRIPE_WIDTH * unit, height * factor - 1), fill=status_style["stripe"])
+        pill_x = TASK_CARD_PILL_X * unit
+        pill_y = TASK_CARD_PILL_Y * unit
+        draw.rounded_rectangle(
+            (pill_x, pill_y, pill_x + TASK_CARD_PILL_WIDTH * unit, pill_y + TASK_CARD_PILL_HEIGHT * unit),
+            radius=TASK_CARD_PILL_HEIGHT / 2 * unit,
+            fill=status_style["pill_bg"],
+        )
+        photo = ImageTk.PhotoImage(image.resize((width, height), Image.LANCZOS))
+        self.sprite_cache[cache_key] = photo
+        return photo
+
+    def _restyle_card_group(self, group: dict, task: dict):
+        """Point an existing card group (from _draw_task_card) at another task."""
+        status_style = TASK_STATUS_STYLES.get(task.get("status", "pending"), TASK_STATUS_STYLES["pending"])
+        *shapes, date_text, title_text, pill_text = group["items"]
+        if self.canvas.type(shapes[0]) == "image":
+            self.canvas.itemconfigure(shapes[0], image=self._card_sprite(status_style, 0.85))
+        else:
+            _background, *stripe_items, pill = shapes
+            for item in stripe_items:
+                self.canvas.itemconfigure(item, fill=status_style["stripe"])
+            self.canvas.itemconfigure(pill, fill=status_style["pill_bg"])
+        self.canvas.itemconfigure(date_text, text=task.get("date", ""))
+        self.canvas.itemconfigure(title_text, text=task.get("title", ""))
+        self.canvas.itemconfigure(pill_text, text=status_style["label"], fill=status_style["pill_fg"])
+        group["signature"] = self._card_signature(task)
+
     def _open_task_modal(self, task: dict | None):
         if not self.logged_in_user:
             messagebox.showinfo("Tareas", "Inicia sesion para gestionar tus tareas.")
@@ -1039,6 +1423,8 @@ class LoginScreen(tk.Tk):
         if not context["date_var"].get().strip():
             context["date_var"].set(context["date_placeholder"])
             date_entry.configure(fg="#7A7C77")
+        context["date_entry"] = date_entry
+        date_entry.bind("<Double-Button-1>", lambda _e: self._show_date_picker(date_entry, context))
 
         status_frame = tk.Frame(modal, bg=BACKGROUND_COLOR)
         status_frame.place(x=self.sw(35), y=self.sh(220))
@@ -1095,6 +1481,96 @@ class LoginScreen(tk.Tk):
 
         title_entry.focus_set()
 
+    def _show_date_picker(self, anchor_widget: tk.Widget, context: dict):
+        import calendar as _cal
+
+        if self._date_picker:
+            try:
+                self._date_picker.destroy()
+            except Exception:
+                pass
+
+        today = date.today()
+        def parse_initial():
+            txt = (context.get("date_var").get() or "").strip()
+            picked = parse_fecha(txt) if txt != context.get("date_placeholder") else None
+            if picked:
+                return picked.year, picked.month
+            return today.year, today.month
+        year, month = parse_initial()
+        picker = tk.Toplevel(self.task_modal_window or self)
+        picker.overrideredirect(True)
+        picker.configure(bg=BACKGROUND_COLOR)
+        self._date_picker = picker
+
+        try:
+            ax = anchor_widget.winfo_rootx()
+            ay = anchor_widget.winfo_rooty() + anchor_widget.winfo_height()
+        except Exception:
+            ax = self.winfo_rootx() + 40
+            ay = self.winfo_rooty() + 40
+        w = int(max(240, round(self.sw(300))))
+        h = int(max(220, round(self.sh(260))))
+        picker.geometry(f"{w}x{h}+{ax}+{ay}")
+
+        frame = tk.Frame(picker, bg=BACKGROUND_COLOR, bd=0, highlightthickness=0)
+        frame.pack(fill='both', expand=True, padx=8, pady=8)
+
+        header = tk.Frame(frame, bg=BACKGROUND_COLOR)
+        header.pack(fill='x')
+        title_lbl = tk.Label(header, text='', bg=BACKGROUND_COLOR, fg=PRIMARY_TEXT_COLOR, font=self._font(18))
+        title_lbl.pack(side='top', pady=(0,6))
+        nav = tk.Frame(header, bg=BACKGROUND_COLOR)
+        nav.pack(fill='x')
+        def redraw(y, m):
+            for child in days.winfo_children():
+                child.destroy()
+            month_name = _cal.month_name[m]
+            title_lbl.configure(text=f"{month_name} {y}")
+            cal = _cal.monthcalendar(y, m)
+            for week in cal:
+                row = tk.Frame(days, bg=BACKGROUND_COLOR)
+                row.pack(fill='x')
+                for d in week:
+                    txt = f"{d:02d}" if d else ''
+                    def make_cmd(day=d, yy=y, mm=m):
+                        return lambda: _select(yy, mm, day) if day else None
+                    btn = tk.Button(row, text=txt, command=make_cmd(), bd=0, padx=8, pady=4,
+                                     bg=WHITE if d else BACKGROUND_COLOR, fg=PRIMARY_TEXT_COLOR,
+                                     activebackground='#F4F7F6', activeforeground=PRIMARY_TEXT_COLOR,
+                                     font=self._font(14))
+                    btn.pack(side='left', expand=True, fill='x', padx=2, pady=2)
+        def prev():
+            nonlocal year, month
+            month -= 1
+            if month == 0:
+                month = 12; year -= 1
+            redraw(year, month)
+        def next_():
+            nonlocal year, month
+            month += 1
+            if month == 13:
+                month = 1; year += 1
+            redraw(year, month)
+        ctrl = tk.Frame(nav, bg=BACKGROUND_COLOR)
+        ctrl.pack()
+        tk.Button(ctrl, text='<', command=prev, bd=0, bg='#EDEEEE', fg=PRIMARY_TEXT_COLOR).pack(side='left', padx=6)
+        tk.Button(ctrl, text='>', command=next_, bd=0, bg='#EDEEEE', fg=PRIMARY_TEXT_COLOR).pack(side='left', padx=6)
+        days = tk.Frame(frame, bg=BACKGROUND_COLOR)
+        days.pack(fill='both', expand=True)
+        def _select(yy, mm, dd):
+            if not dd: return
+            context['date_var'].set(f"{dd:02d}/{mm:02d}/{yy:04d}")
+            context['date_entry'].configure(fg=PRIMARY_TEXT_COLOR)
+            try:
+                picker.destroy()
+            except Exception:
+                pass
+        redraw(year, month)
+
+        picker.bind('<FocusOut>', lambda _e: picker.destroy())
+        picker.focus_force()
+
     def _set_modal_status(self, status: str):
         if not self.task_modal_context:
             return
@@ -1114,9 +1590,27 @@ class LoginScreen(tk.Tk):
                 done_button.configure(bg=self._apply_opacity(WHITE, 0.6), fg=PRIMARY_TEXT_COLOR)
 
     def _close_task_modal(self, save: bool):
-        if save and self.task_modal_context:
-            if not self._persist_task_modal():
+        context = self.task_modal_context
+        if save and context and self.logged_in_user:
+            if context.get("saving"):
                 return
+            values = self._validate_task_modal()
+            if values is None:
+                return
+            task_id = context["task"].get("id") if context["mode"] == "edit" else None
+            context["saving"] = True
+            self.executor.submit(
+                "screen",
+                self._persist_task,
+                self.logged_in_user["id"],
+                task_id,
+                *values,
+                on_done=lambda error: self._on_task_saved(context, error),
+            )
+            return
+        self._dismiss_task_modal()
+
+    def _dismiss_task_modal(self):
         if self.task_modal_window:
             try:
                 self.task_modal_window.grab_release()
@@ -1128,13 +1622,11 @@ class LoginScreen(tk.Tk):
         self.task_modal_window = None
         self.task_modal_overlay = None
         self.task_modal_context = None
+        self._date_picker = None
         self._refresh_task_board()
 
-    def _persist_task_modal(self) -> bool:
+    def _validate_task_modal(self) -> tuple[str, str, bool] | None:
         context = self.task_modal_context
-        if not context or not self.logged_in_user:
-            return True
-
         title = context["title_var"].get().strip()
         date_text = context["date_var"].get().strip()
 
@@ -1147,39 +1639,43 @@ class LoginScreen(tk.Tk):
 
         if not title:
             messagebox.showerror("Tareas", "Ingresa el titulo de la tarea.")
-            return False
+            return None
         if date_text and not self._parse_due_date(date_text):
             messagebox.showerror("Tareas", "Ingresa la fecha en formato DD/MM/AAAA.")
-            return False
-        if context["mode"] == "edit" and context["task"].get("id"):
-            ok = actualizar_tarea(
-                self.logged_in_user["email"],
-                context["task"]["id"],
-                title,
-                date_text,
-                is_done,
-            )
-            if not ok:
-                messagebox.showerror("Tareas", "No se pudo actualizar la tarea.")
-                return False
-        else:
-            if not date_text:
-                messagebox.showerror("Tareas", "Ingresa la fecha en formato DD/MM/AAAA.")
-                return False
-            ok = agregar_tarea(
-                self.logged_in_user["email"],
-                title,
-                date_text,
-                is_done,
-            )
-            if not ok:
-                messagebox.showerror("Tareas", "No se pudo crear la tarea.")
-                return False
-        return True
+            return None
+        if context["mode"] != "edit" and not date_text:
+            messagebox.showerror("Tareas", "Ingresa la fecha en formato DD/MM/AAAA.")
+            return None
+        return title, date_text, is_done
+
+    @staticmethod
+    def _persist_task(user_id: int, task_id, title: str, date_text: str, is_done: bool) -> str | None:
+        """Runs on a worker thread: must not touch Tk. Returns an error message or None."""
+        if task_id:
+            if not actualizar_tarea(user_id, task_id, title, date_text, is_done):
+                return "No se pudo actualizar la tarea."
+        elif not agregar_tarea(user_id, title, date_text, is_done):
+            return "No se pudo crear la tarea."
+        return None
+
+    def _on_task_saved(self, context: dict, error: str | None):
+        if context is not self.task_modal_context:
+            if not error:
+                self._refresh_task_board()
+            return
+        context["saving"] = False
+        if error:
+            messagebox.showerror("Tareas", error)
+            return
+        self._dismiss_task_modal()
 
     def _refresh_task_board(self):
-        if self.current_screen == "tasks":
+        if self.current_screen != "tasks":
+            return
+        if self.task_board is None:
             self.show_tasks_screen()
+            return
+        self._sync_task_board()
 
     def _draw_login_ui(self):
         headline_x, headline_y, headline_w, headline_h = LOGIN_HEADLINE_FRAME
@@ -1667,6 +2163,8 @@ class LoginScreen(tk.Tk):
 
 
     def _on_login_click(self):
+        if self.login_busy:
+            return
         email = self.email_var.get().strip().lower()
         password = self.password_var.get()
 
@@ -1680,12 +2178,34 @@ class LoginScreen(tk.Tk):
             self._set_login_error("*Ingresa un correo valido.")
             return
 
-        ok, msg = auth_login(email, password)
+        self.login_busy = True
+        self._set_login_error("Iniciando sesion...", color=PRIMARY_TEXT_COLOR)
+        self.executor.submit(
+            "screen",
+            self._authenticate,
+            email,
+            password,
+            on_done=lambda result: self._on_login_result(email, *result),
+            on_error=lambda _exc: self._on_login_result(email, False, None, service_message("unexpected_error")),
+        )
+
+    @staticmethod
+    def _authenticate(email: str, password: str) -> tuple[bool, dict | None, str]:
+        """Runs on a worker thread: must not touch Tk. The password check itself
+        runs in the auth_service process pool; the profile comes back with it."""
+        ok, msg, profile = auth_login_async(email, password).result()
+        return ok, profile, msg
+
+    def _on_login_result(self, email: str, ok: bool, profile: dict | None, msg: str = ""):
+        self.login_busy = False
         if not ok:
-            self._set_login_error("*Correo o contraseña incorrecto/s.")
+            # Lockouts and a busy login pool are not a wrong password: say so,
+            # or the user keeps retrying.
+            if msg and msg != service_message("auth_fail"):
+                self._set_login_error(f"*{msg}")
+            else:
+                self._set_login_error("*Correo o contraseña incorrecto/s.")
             return
-
-        profile = self._load_user_profile(email)
         if not profile:
             self._set_login_error("*No se pudo cargar el perfil.")
             return
@@ -1696,6 +2216,8 @@ class LoginScreen(tk.Tk):
         self.show_tasks_screen()
 
     def _on_register_submit(self):
+        if self.register_busy:
+            return
         name = self.name_var.get().strip()
         email = self.reg_email_var.get().strip().lower()
         password = self.reg_password_var.get()
@@ -1719,7 +2241,20 @@ class LoginScreen(tk.Tk):
             self._set_register_error("*Las contraseñas no coinciden.")
             return
 
-        ok, msg = registrar_usuario(email, password, name)
+        self.register_busy = True
+        self._set_register_error("Creando cuenta...", color=PRIMARY_TEXT_COLOR)
+        self.executor.submit(
+            "screen",
+            registrar_usuario,
+            email,
+            password,
+            name,
+            on_done=lambda result: self._on_register_result(email, *result),
+            on_error=lambda exc: self._on_register_result(email, False, str(exc)),
+        )
+
+    def _on_register_result(self, email: str, ok: bool, msg: str, profile: dict | None = None):
+        self.register_busy = False
         if not ok:
             self._set_register_error("*" + msg)
             return
@@ -1727,138 +2262,32 @@ class LoginScreen(tk.Tk):
         self._set_register_error("")
         self.pending_email = email
         messagebox.showinfo("Crear cuenta", mostrar_mensaje_exito(msg))
-        self.show_login_screen()
+        if profile:
+            # registrar_usuario already returns the new profile: sign in with it.
+            self.logged_in_user = profile
+            self.show_tasks_screen()
+        else:
+            self.show_login_screen()
 
-    def _set_login_error(self, message: str):
+    def _set_login_error(self, message: str, color: str = ERROR_COLOR):
         if self.login_error_item:
-            self.canvas.itemconfigure(self.login_error_item, text=message)
+            self.canvas.itemconfigure(self.login_error_item, text=message, fill=color)
 
-    def _set_register_error(self, message: str):
+    def _set_register_error(self, message: str, color: str = ERROR_COLOR):
         if self.register_error_item:
-            self.canvas.itemconfigure(self.register_error_item, text=message)
+            self.canvas.itemconfigure(self.register_error_item, text=message, fill=color)
 
 def main():
+    multiprocessing.freeze_support()
+    cargar_hasher_guardado()
+    avisos = NotificationQueue()
+    reminders = ReminderScheduler(avisos)
+    reminders.start()
     app = LoginScreen()
     app.mainloop()
+    reminders.stop()
+    avisos.close()
 
 
 if __name__ == "__main__":
     main()
-
-
-
-
-
-    def _on_mouse_wheel(self, event):
-
-        units = -1 * int(event.delta / 120)
-        try:
-            self.canvas.yview_scroll(units, "units")
-        except Exception:
-            pass
-
-    def _show_date_picker(self, anchor_widget: tk.Widget, context: dict):
-        import calendar as _cal
-
-        if hasattr(self, "_date_picker") and self._date_picker:
-            try:
-                self._date_picker.destroy()
-            except Exception:
-                pass
-
-        today = date.today()
-        def parse_initial():
-            txt = (context.get("date_var").get() or "").strip()
-            try:
-                if txt and txt != context.get("date_placeholder"):
-                    dd, mm, yyyy = [int(x) for x in txt.replace('-', '/').split('/')]
-                    return yyyy, mm
-            except Exception:
-                pass
-            return today.year, today.month
-        year, month = parse_initial()
-        picker = tk.Toplevel(self.task_modal_window or self)
-        picker.overrideredirect(True)
-        picker.configure(bg=BACKGROUND_COLOR)
-        self._date_picker = picker
-
-        try:
-            ax = anchor_widget.winfo_rootx()
-            ay = anchor_widget.winfo_rooty() + anchor_widget.winfo_height()
-        except Exception:
-            ax = self.winfo_rootx() + 40
-            ay = self.winfo_rooty() + 40
-        w = int(max(240, round(self.sw(300))))
-        h = int(max(220, round(self.sh(260))))
-        picker.geometry(f"{w}x{h}+{ax}+{ay}")
-
-        frame = tk.Frame(picker, bg=BACKGROUND_COLOR, bd=0, highlightthickness=0)
-        frame.pack(fill='both', expand=True, padx=8, pady=8)
-
-        header = tk.Frame(frame, bg=BACKGROUND_COLOR)
-        header.pack(fill='x')
-        title_lbl = tk.Label(header, text='', bg=BACKGROUND_COLOR, fg=PRIMARY_TEXT_COLOR, font=self._font(18))
-        title_lbl.pack(side='top', pady=(0,6))
-        nav = tk.Frame(header, bg=BACKGROUND_COLOR)
-        nav.pack(fill='x')
-        def redraw(y, m):
-            for child in days.winfo_children():
-                child.destroy()
-            month_name = _cal.month_name[m]
-            title_lbl.configure(text=f"{month_name} {y}")
-            cal = _cal.monthcalendar(y, m)
-            for week in cal:
-                row = tk.Frame(days, bg=BACKGROUND_COLOR)
-                row.pack(fill='x')
-                for d in week:
-                    txt = f"{d:02d}" if d else ''
-                    def make_cmd(day=d, yy=y, mm=m):
-                        return lambda: _select(yy, mm, day) if day else None
-                    btn = tk.Button(row, text=txt, command=make_cmd(), bd=0, padx=8, pady=4,
-                                     bg=WHITE if d else BACKGROUND_COLOR, fg=PRIMARY_TEXT_COLOR,
-                                     activebackground='#F4F7F6', activeforeground=PRIMARY_TEXT_COLOR,
-                                     font=self._font(14))
-                    btn.pack(side='left', expand=True, fill='x', padx=2, pady=2)
-        def prev():
-            nonlocal year, month
-            month -= 1
-            if month == 0:
-                month = 12; year -= 1
-            redraw(year, month)
-        def next_():
-            nonlocal year, month
-            month += 1
-            if month == 13:
-                month = 1; year += 1
-            redraw(year, month)
-        ctrl = tk.Frame(nav, bg=BACKGROUND_COLOR)
-        ctrl.pack()
-        tk.Button(ctrl, text='<', command=prev, bd=0, bg='#EDEEEE', fg=PRIMARY_TEXT_COLOR).pack(side='left', padx=6)
-        tk.Button(ctrl, text='>', command=next_, bd=0, bg='#EDEEEE', fg=PRIMARY_TEXT_COLOR).pack(side='left', padx=6)
-        days = tk.Frame(frame, bg=BACKGROUND_COLOR)
-        days.pack(fill='both', expand=True)
-        def _select(yy, mm, dd):
-            if not dd: return
-            context['date_var'].set(f"{dd:02d}/{mm:02d}/{yy:04d}")
-            try:
-                picker.destroy()
-            except Exception:
-                pass
-        redraw(year, month)
-
-        picker.bind('<FocusOut>', lambda _e: picker.destroy())
-        picker.focus_force()
-
-
-
-
-
-
-
-
-
-
-
-
-
-
@@ -1,63 +1,558 @@
-from hashlib import sha256
-from uuid import uuid4
+import atexit
+import csv
+import json
+import os
+import secrets
+import sqlite3
+import string
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import hashers
+from cache import TTLCache
 from db import get_conn
 from mensajes_adapter import t
+from rate_limit import SlidingWindowLimiter
+
+try:
+    from validaciones import es_correo_valido, es_contrasena_valida
+except Exception:
+    def es_correo_valido(correo: str) -> bool:
+        return isinstance(correo, str) and "@" in correo and "." in correo.split("@", 1)[-1]
+
+    def es_contrasena_valida(contrasena: str) -> bool:
+        if not isinstance(contrasena, str) or len(contrasena) < 8:
+            return False
+        return any(c.isalpha() for c in contrasena) and any(c.isdigit() for c in contrasena)
 
 def hash_password(password: str) -> str:
-    """Genera una cadena 'salt$hash' segura para guardar en la base de datos."""
-    salt = uuid4().hex
-    digest = sha256((salt + password).encode()).hexdigest()
-    return f"{salt}${digest}"
+    """Genera el hash para guardar en la base de datos con el hasher actual."""
+    return hashers.hash_password(password)
 
 def verify_password(password: str, stored: str) -> bool:
     """Verifica una contraseña ingresada contra el hash almacenado."""
+    return hashers.verify_password(password, stored)[0]
+
+
+def _guardar_hash(correo: str, nuevo: str, anterior: str):
+    try:
+        with get_conn() as con:
+            con.execute(
+                "UPDATE usuarios SET contrasena=? WHERE correo=? AND contrasena=?",
+                (nuevo, correo, anterior),
+            )
+    except Exception as e:
+        print("Error actualizando el hash:", e)
+
+
+# El algoritmo y costo calibrados para esta máquina se guardan en la tabla
+# `ajustes`; la app los aplica al arrancar con cargar_hasher_guardado().
+AJUSTE_HASHER = "hasher"
+
+
+def guardar_hasher(nombre: str, **params):
+    """Aplica `nombre` con `params` (ver hashers.set_hasher) y lo deja guardado
+    para los siguientes arranques."""
+    hashers.set_hasher(nombre, **params)
+    valor = json.dumps({"algoritmo": nombre, "params": hashers.current_hasher().params()})
+    with get_conn() as con:
+        con.execute(
+            "INSERT INTO ajustes(clave, valor) VALUES(?, ?) "
+            "ON CONFLICT(clave) DO UPDATE SET valor=excluded.valor",
+            (AJUSTE_HASHER, valor),
+        )
+
+
+def cargar_hasher_guardado() -> bool:
+    """Aplica el hasher guardado con guardar_hasher, si hay uno."""
     try:
-        salt, digest = stored.split("$")
-        return sha256((salt + password).encode()).hexdigest() == digest
-    except Exception:
+        fila = get_conn().execute("SELECT valor FROM ajustes WHERE clave=?", (AJUSTE_HASHER,)).fetchone()
+        if fila is None:
+            return False
+        ajuste = json.loads(fila["valor"])
+        hashers.set_hasher(ajuste["algoritmo"], **ajuste.get("params", {}))
+        return True
+    except Exception as e:
+        print("Error cargando el hasher guardado:", e)
         return False
 
 
+# --- Límite de intentos ------------------------------------------------------
+# Los fallos se cuentan por correo y, si el llamador lo indica, por origen (por
+# ejemplo la máquina o el script que autentica). Con demasiados fallos en la
+# ventana el login se rechaza sin tocar la base ni calcular el hash. Los correos
+# que no existen se recuerdan un rato para no volver a consultarlos.
+LIMITE_POR_CORREO = 5
+LIMITE_POR_ORIGEN = 20
+VENTANA_FALLOS = 300.0
+
+_por_correo = SlidingWindowLimiter(LIMITE_POR_CORREO, VENTANA_FALLOS)
+_por_origen = SlidingWindowLimiter(LIMITE_POR_ORIGEN, VENTANA_FALLOS)
+_desconocidos = TTLCache(4096, VENTANA_FALLOS)
+_persistir_fallos = False
+
+
+def configurar_limites(
+    por_correo: int = LIMITE_POR_CORREO,
+    por_origen: int = LIMITE_POR_ORIGEN,
+    ventana: float = VENTANA_FALLOS,
+    persistir: bool = False,
+):
+    """Cambia los límites de intentos fallidos.
+
+    Con `persistir=True` cada fallo se guarda en la tabla `login_fallos` y los
+    que siguen dentro de la ventana se cargan ahora, así un reinicio no borra
+    un bloqueo.
+    """
+    global _por_correo, _por_origen, _desconocidos, _persistir_fallos
+    _por_correo = SlidingWindowLimiter(por_correo, ventana)
+    _por_origen = SlidingWindowLimiter(por_origen, ventana)
+    _desconocidos = TTLCache(4096, ventana)
+    _persistir_fallos = persistir
+    if not persistir:
+        return
+    desde = time.time() - ventana
+    with get_conn() as con:
+        con.execute("DELETE FROM login_fallos WHERE momento <= ?", (desde,))
+        filas = con.execute(
+            "SELECT clave, momento FROM login_fallos ORDER BY momento"
+        ).fetchall()
+    for clave, momento in filas:
+        limitador = _por_origen if clave.startswith("origen:") else _por_correo
+        limitador.record_failure(clave, momento)
+
+
+def _rechazo_previo(correo: str, origen: str | None) -> str | None:
+    """Clave del mensaje si el intento se rechaza antes de ir a la base."""
+    if not _por_correo.allowed(f"correo:{correo}"):
+        return "auth_locked"
+    if origen and not _por_origen.allowed(f"origen:{origen}"):
+        return "auth_locked"
+    if _desconocidos.get(correo):
+        _registrar_fallo(correo, origen)
+        return "auth_fail"
+    return None
+
+
+def _registrar_fallo(correo: str, origen: str | None):
+    claves = [f"correo:{correo}"] + ([f"origen:{origen}"] if origen else [])
+    momento = time.time()
+    _por_correo.record_failure(claves[0], momento)
+    if origen:
+        _por_origen.record_failure(claves[1], momento)
+    if _persistir_fallos:
+        try:
+            with get_conn() as con:
+                con.executemany(
+                    "INSERT INTO login_fallos(clave, momento) VALUES(?,?)",
+                    [(clave, momento) for clave in claves],
+                )
+        except Exception as e:
+            print("Error guardando el intento fallido:", e)
+
+
+def _registrar_exito(correo: str):
+    _por_correo.reset(f"correo:{correo}")
+    if _persistir_fallos:
+        try:
+            with get_conn() as con:
+                con.execute("DELETE FROM login_fallos WHERE clave=?", (f"correo:{correo}",))
+        except Exception as e:
+            print("Error limpiando los intentos fallidos:", e)
+
+
+def auth_stats() -> dict:
+    """Contadores del límite de intentos y de la caché de correos desconocidos."""
+    return {
+        "por_correo": _por_correo.stats(),
+        "por_origen": _por_origen.stats(),
+        "desconocidos": _desconocidos.stats(),
+        "persistente": _persistir_fallos,
+    }
+
+
+
+# El correo duplicado lo detecta la restricción UNIQUE: el INSERT no hace nada
+# y no devuelve id. RETURNING existe desde SQLite 3.35; antes se usa lastrowid.
+_HAY_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+
+def perfil_usuario(usuario_id: int, correo: str, nombre: str | None) -> dict:
+    """Perfil que usa la interfaz: {"id", "email", "name"}."""
+    return {"id": usuario_id, "email": correo, "name": nombre or correo.split("@", 1)[0].title()}
+
+
+def _insertar_usuario(con: sqlite3.Connection, correo: str, contrasena_hash: str, nombre: str) -> int | None:
+    """Id del usuario nuevo, o None si el correo ya estaba registrado."""
+    if _HAY_RETURNING:
+        row = con.execute(
+            "INSERT INTO usuarios(correo, contrasena, nombre) VALUES(?,?,?) "
+            "ON CONFLICT(correo) DO NOTHING RETURNING id",
+            (correo, contrasena_hash, nombre),
+        ).fetchone()
+        return row[0] if row else None
+    cur = con.execute(
+        "INSERT INTO usuarios(correo, contrasena, nombre) VALUES(?,?,?) ON CONFLICT(correo) DO NOTHING",
+        (correo, contrasena_hash, nombre),
+    )
+    return cur.lastrowid if cur.rowcount == 1 else None
+
 
 def registrar_usuario(correo: str, contrasena: str, nombre: str = ""):
+    """Devuelve `(ok, mensaje, perfil)`; perfil es None si no se registró."""
     correo = correo.strip().lower()
     try:
+        contrasena_hash = hash_password(contrasena)
         with get_conn() as con:
-            existe = con.execute(
-                "SELECT 1 FROM usuarios WHERE correo = ?", (correo,)
-            ).fetchone()
-            if existe:
-                return False, t("user_exists")
-
-            contrasena_hash = hash_password(contrasena)
-            con.execute(
-                "INSERT INTO usuarios(correo, contrasena, nombre) VALUES(?,?,?)",
-                (correo, contrasena_hash, nombre),
-            )
-        return True, t("auth_ok")
+            usuario_id = _insertar_usuario(con, correo, contrasena_hash, nombre)
+        if usuario_id is None:
+            return False, t("user_exists"), None
+        _desconocidos.discard(correo)
+        return True, t("auth_ok"), perfil_usuario(usuario_id, correo, nombre)
     except Exception as e:
         print("Error en registrar_usuario:", e)
-        return False, t("invalid_input")
+        return False, t("invalid_input"), None
+
+
+_SELECT_LOGIN = "SELECT id, correo, contrasena, nombre FROM usuarios WHERE correo=?"
 
 
-def login(correo: str, contrasena: str):
+def login(correo: str, contrasena: str, origen: str | None = None):
+    """Devuelve `(ok, mensaje, perfil)`. El perfil ({"id", "email", "name"})
+    sale de la misma consulta que trae el hash; es None si el login falla."""
     correo = correo.strip().lower()
+    rechazo = _rechazo_previo(correo, origen)
+    if rechazo:
+        return False, t(rechazo), None
     try:
         with get_conn() as con:
-            row = con.execute(
-                "SELECT contrasena FROM usuarios WHERE correo=?",
-                (correo,),
-            ).fetchone()
+            row = con.execute(_SELECT_LOGIN, (correo,)).fetchone()
 
         if not row:
-            return False, t("auth_fail")
+            _desconocidos.set(correo, True)
+            _registrar_fallo(correo, origen)
+            return False, t("auth_fail"), None
+
+        stored_hash = row["contrasena"] or ""
+        ok, rehacer = hashers.verify_password(contrasena, stored_hash)
+        if not ok:
+            _registrar_fallo(correo, origen)
+            return False, t("auth_fail"), None
+        if rehacer:
+            _guardar_hash(correo, hash_password(contrasena), stored_hash)
+        _registrar_exito(correo)
+        return True, t("auth_ok"), perfil_usuario(row["id"], row["correo"], row["nombre"])
+
+    except Exception as e:
+        print("Error en login:", e)
+        return False, t("invalid_input"), None
+
+
+# --- Login en segundo plano -------------------------------------------------
+# El hash de contraseñas es caro a propósito (ver hashers). login_async lo
+# calcula en un pool de procesos: scrypt usa decenas de MB por hash y así no
+# compite con la interfaz por el GIL ni por memoria del proceso principal.
+# Solo se aceptan MAX_LOGINS_PENDIENTES intentos a la vez; el resto se rechaza
+# de inmediato con t("auth_busy").
+MAX_LOGINS_PENDIENTES = 32
 
-        stored_hash = row["contrasena"]
-        if verify_password(contrasena, stored_hash) or stored_hash == contrasena:
-            return True, t("auth_ok")
-        else:
-            return False, t("auth_fail")
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+_cupos = threading.BoundedSemaphore(MAX_LOGINS_PENDIENTES)
+_latencias: deque[float] = deque(maxlen=1000)
+_login_stats = {"ok": 0, "fail": 0, "rejected": 0, "pending": 0}
 
+# Los callbacks de los futures del pool corren en el hilo interno que reparte
+# sus resultados; ahí solo se decide el resultado. Lo que escribe en la base
+# (hash rehecho, fallos y éxitos) va a este hilo propio, que tiene su propia
+# conexión y no retrasa la entrega de los demás logins.
+_posteriores = ThreadPoolExecutor(max_workers=1, thread_name_prefix="abhub-auth")
+
+
+def _pool_logins() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1))
+        return _pool
+
+
+def cerrar_pool_logins():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+atexit.register(cerrar_pool_logins)
+
+
+def _descartar_pool(roto: ProcessPoolExecutor):
+    """Olvida un pool que quedó roto (un proceso murió, por ejemplo por falta de
+    memoria con scrypt); el siguiente envío crea uno nuevo."""
+    global _pool
+    with _pool_lock:
+        if _pool is roto:
+            _pool = None
+    roto.shutdown(wait=False, cancel_futures=True)
+
+
+def _enviar_al_pool(fn, *args) -> tuple[ProcessPoolExecutor, Future]:
+    """Envía `fn` al pool; si el pool ya estaba roto, lo cambia y reintenta una vez."""
+    pool = _pool_logins()
+    try:
+        return pool, pool.submit(fn, *args)
+    except BrokenProcessPool:
+        _descartar_pool(pool)
+        pool = _pool_logins()
+        return pool, pool.submit(fn, *args)
+
+
+def _verificar_en_proceso(contrasena: str, guardada: str, hasher: str, params: dict) -> tuple[bool, str | None]:
+    """Corre en el pool de procesos. Devuelve `(ok, hash_nuevo)`; hash_nuevo
+    solo viene cuando el guardado quedó viejo."""
+    if hashers.current_hasher().algoritmo != hasher or hashers.current_hasher().params() != params:
+        hashers.set_hasher(hasher, **params)
+    ok, rehacer = hashers.verify_password(contrasena, guardada)
+    return ok, (hashers.hash_password(contrasena) if ok and rehacer else None)
+
+
+def _resuelto(resultado) -> Future:
+    future = Future()
+    future.set_result(resultado)
+    return future
+
+
+def login_async(correo: str, contrasena: str, origen: str | None = None) -> Future:
+    """Como `login`, pero la verificación corre en el pool de procesos.
+
+    Devuelve un Future con `(ok, mensaje, perfil)`. La lectura del usuario se hace en
+    el hilo que llama, así que conviene llamarla fuera del hilo de Tk.
+    """
+    correo = correo.strip().lower()
+    rechazo = _rechazo_previo(correo, origen)
+    if rechazo:
+        return _resuelto((False, t(rechazo), None))
+    if not _cupos.acquire(blocking=False):
+        with _pool_lock:
+            _login_stats["rejected"] += 1
+        return _resuelto((False, t("auth_busy"), None))
+    with _pool_lock:
+        _login_stats["pending"] += 1
+    inicio = time.perf_counter()
+    resultado = Future()
+
+    def terminar(ok: bool, mensaje: str, perfil: dict | None = None):
+        _cupos.release()
+        with _pool_lock:
+            _latencias.append((time.perf_counter() - inicio) * 1000)
+            _login_stats["ok" if ok else "fail"] += 1
+            _login_stats["pending"] -= 1
+        resultado.set_result((ok, mensaje, perfil))
+
+    try:
+        with get_conn() as con:
+            row = con.execute(_SELECT_LOGIN, (correo,)).fetchone()
+        if not row:
+            _desconocidos.set(correo, True)
+            _registrar_fallo(correo, origen)
+            terminar(False, t("auth_fail"))
+            return resultado
+        guardada = row["contrasena"] or ""
+        actual = hashers.current_hasher()
+        argumentos = (contrasena, guardada, actual.algoritmo, actual.params())
+        pool, verificacion = _enviar_al_pool(_verificar_en_proceso, *argumentos)
     except Exception as e:
         print("Error en login:", e)
-        return False, t("invalid_input")
+        terminar(False, t("invalid_input"))
+        return resultado
+
+    def al_verificar(future: Future, pool: ProcessPoolExecutor, reintento: bool = False):
+        try:
+            ok, nuevo = future.result()
+        except BrokenProcessPool as e:
+            # El pool se rompió con este intento en curso: se cambia por uno
+            # nuevo y se verifica otra vez, una sola.
+            _descartar_pool(pool)
+            if not reintento:
+                try:
+                    nuevo_pool, otra = _enviar_al_pool(_verificar_en_proceso, *argumentos)
+                    otra.add_done_callback(lambda f: al_verificar(f, nuevo_pool, True))
+                    return
+                except Exception as e:
+                    print("Error en login:", e)
+            else:
+                print("Error en login:", e)
+            terminar(False, t("invalid_input"))
+            return
+        except Exception as e:
+            print("Error en login:", e)
+            terminar(False, t("invalid_input"))
+            return
+        try:
+            _posteriores.submit(completar, ok, nuevo)
+        except RuntimeError as e:
+            # El intérprete se está cerrando.
+            print("Error en login:", e)
+            terminar(False, t("invalid_input"))
+
+    def completar(ok: bool, nuevo: str | None):
+        if nuevo:
+            _guardar_hash(correo, nuevo, guardada)
+        if not ok:
+            _registrar_fallo(correo, origen)
+            terminar(False, t("auth_fail"))
+            return
+        _registrar_exito(correo)
+        terminar(True, t("auth_ok"), perfil_usuario(row["id"], row["correo"], row["nombre"]))
+
+    verificacion.add_done_callback(lambda f: al_verificar(f, pool))
+    return resultado
+
+
+def login_stats() -> dict:
+    """Intentos de login_async y su latencia (ms) en los últimos 1000."""
+    with _pool_lock:
+        stats = dict(_login_stats)
+        ultima = _latencias[-1] if _latencias else None
+        latencias = sorted(_latencias)
+    if latencias:
+        stats.update(
+            last_ms=ultima,
+            p50_ms=latencias[len(latencias) // 2],
+            p95_ms=latencias[min(len(latencias) - 1, int(len(latencias) * 0.95))],
+            max_ms=latencias[-1],
+        )
+    return stats
+
+
+# --- Alta masiva --------------------------------------------------------------
+def _hashear_en_proceso(contrasena: str, hasher: str, params: dict) -> str:
+    """Corre en el pool de procesos."""
+    if hashers.current_hasher().algoritmo != hasher or hashers.current_hasher().params() != params:
+        hashers.set_hasher(hasher, **params)
+    return hashers.hash_password(contrasena)
+
+
+def _hashear_en_pool(contrasenas: list[str], hasher: str, params: dict) -> list[str]:
+    """Hashes de `contrasenas` en el pool; si el pool se rompe, reintenta una
+    vez con uno nuevo."""
+    for intento in range(2):
+        pool = _pool_logins()
+        try:
+            return list(pool.map(
+                _hashear_en_proceso, contrasenas, [hasher] * len(contrasenas), [params] * len(contrasenas)
+            ))
+        except BrokenProcessPool:
+            _descartar_pool(pool)
+            if intento:
+                raise
+
+
+def generar_contrasena(largo: int = 10) -> str:
+    """Contraseña al azar con letras y números (pasa es_contrasena_valida)."""
+    alfabeto = string.ascii_letters + string.digits
+    while True:
+        contrasena = "".join(secrets.choice(alfabeto) for _ in range(largo))
+        if any(c.isalpha() for c in contrasena) and any(c.isdigit() for c in contrasena):
+            return contrasena
+
+
+def provisionar_usuarios(filas) -> dict:
+    """Da de alta muchos usuarios de una vez (por ejemplo un grupo completo).
+
+    `filas` son dicts con "correo", y opcionalmente "nombre" y "contrasena";
+    sin contraseña se genera una. Las contraseñas dadas tienen que pasar
+    es_contrasena_valida, como en la pantalla de registro. Los correos ya registrados se saltan antes
+    de calcular su hash. Los hashes se calculan en el pool de procesos del
+    login y las altas van en una sola transacción. Devuelve:
+
+        {"creados": [perfil + "contrasena" generada o None],
+         "existentes": [correo, ...],
+         "invalidos": [(numero_de_fila, motivo), ...]}
+    """
+    resultado = {"creados": [], "existentes": [], "invalidos": []}
+    pendientes = {}
+    for numero, fila in enumerate(filas, start=1):
+        correo = str(fila.get("correo") or "").strip().lower()
+        if not es_correo_valido(correo):
+            resultado["invalidos"].append((numero, t("invalid_input")))
+            continue
+        contrasena = str(fila.get("contrasena") or "")
+        if contrasena and not es_contrasena_valida(contrasena):
+            resultado["invalidos"].append((numero, t("password_weak")))
+            continue
+        if correo in pendientes:
+            resultado["existentes"].append(correo)
+            continue
+        nombre = str(fila.get("nombre") or "").strip()
+        generada = None if contrasena else generar_contrasena()
+        pendientes[correo] = (nombre, contrasena or generada, generada)
+    if not pendientes:
+        return resultado
+
+    correos = list(pendientes)
+    with get_conn() as con:
+        existentes = set()
+        for inicio in range(0, len(correos), 500):
+            bloque = correos[inicio:inicio + 500]
+            marcas = ",".join("?" * len(bloque))
+            existentes.update(
+                row[0] for row in con.execute(f"SELECT correo FROM usuarios WHERE correo IN ({marcas})", bloque)
+            )
+    nuevos = [correo for correo in correos if correo not in existentes]
+    resultado["existentes"].extend(correo for correo in correos if correo in existentes)
+
+    actual = hashers.current_hasher()
+    hashes = _hashear_en_pool(
+        [pendientes[correo][1] for correo in nuevos], actual.algoritmo, actual.params()
+    )
+    with get_conn() as con:
+        for correo, contrasena_hash in zip(nuevos, hashes):
+            nombre, _, generada = pendientes[correo]
+            usuario_id = _insertar_usuario(con, correo, contrasena_hash, nombre)
+            if usuario_id is None:
+                # Se registró entre la consulta y el alta.
+                resultado["existentes"].append(correo)
+                continue
+            perfil = perfil_usuario(usuario_id, correo, nombre)
+            perfil["contrasena"] = generada
+            resultado["creados"].append(perfil)
+    for perfil in resultado["creados"]:
+        _desconocidos.discard(perfil["email"])
+    return resultado
+
+
+_COLUMNAS_CSV = {
+    "correo": "correo", "email": "correo", "e-mail": "correo",
+    "nombre": "nombre", "name": "nombre",
+    "contrasena": "contrasena", "contraseña": "contrasena", "password": "contrasena",
+}
+
+
+def leer_csv_usuarios(ruta) -> list[dict]:
+    """Filas de un CSV con encabezados correo/email, nombre/name y (opcional)
+    contrasena/password, con las claves que espera `provisionar_usuarios`.
+    Acepta ',' o ';' como separador, o una sola columna."""
+    with open(ruta, newline="", encoding="utf-8-sig") as archivo:
+        muestra = archivo.read(4096)
+        archivo.seek(0)
+        try:
+            dialecto = csv.Sniffer().sniff(muestra, delimiters=",;")
+        except csv.Error:
+            # Muestra vacía o de una sola columna: no hay separador que adivinar.
+            dialecto = csv.excel
+        lector = csv.DictReader(archivo, dialect=dialecto)
+        return [
+            {_COLUMNAS_CSV.get((clave or "").strip().lower(), clave): valor for clave, valor in fila.items()}
+            for fila in lector
+        ]
+
+
+def provisionar_desde_csv(ruta) -> dict:
+    """Como `provisionar_usuarios`, leyendo las filas con `leer_csv_usuarios`."""
+    return provisionar_usuarios(leer_csv_usuarios(ruta))
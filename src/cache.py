@@ -0,0 +1,71 @@
+"""Caché en memoria con vencimiento (TTL) y tamaño máximo (LRU).
+
+Es segura entre hilos y lleva la cuenta de aciertos, fallos y expulsiones.
+"""
+import threading
+import time
+from collections import OrderedDict
+
+_FALTA = object()
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._datos: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, clave, default=None):
+        ahora = time.monotonic()
+        with self._lock:
+            item = self._datos.get(clave, _FALTA)
+            if item is not _FALTA and item[0] > ahora:
+                self._datos.move_to_end(clave)
+                self._stats["hits"] += 1
+                return item[1]
+            if item is not _FALTA:
+                del self._datos[clave]
+            self._stats["misses"] += 1
+            return default
+
+    def set(self, clave, valor):
+        with self._lock:
+            self._datos[clave] = (time.monotonic() + self.ttl, valor)
+            self._datos.move_to_end(clave)
+            while len(self._datos) > self.maxsize:
+                self._datos.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_load(self, clave, cargar):
+        """Devuelve el valor guardado o lo calcula con `cargar()` y lo guarda."""
+        valor = self.get(clave, _FALTA)
+        if valor is _FALTA:
+            valor = cargar()
+            self.set(clave, valor)
+        return valor
+
+    def discard(self, clave):
+        with self._lock:
+            if self._datos.pop(clave, _FALTA) is not _FALTA:
+                self._stats["invalidations"] += 1
+
+    def discard_where(self, condicion):
+        """Quita todas las entradas cuya clave cumple `condicion(clave)`."""
+        with self._lock:
+            quitar = [clave for clave in self._datos if condicion(clave)]
+            for clave in quitar:
+                del self._datos[clave]
+            self._stats["invalidations"] += len(quitar)
+
+    def clear(self):
+        with self._lock:
+            self._datos.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats, size=len(self._datos))
+
+    def __len__(self):
+        return len(self._datos)
@@ -0,0 +1,71 @@
+"""Lectura de las fechas que escriben los usuarios en las tareas.
+
+Acepta DD/MM/AAAA, DD/MM/AA, DD-MM-AAAA, AAAA-MM-DD y DD/MM (se completa con
+`anio` o con el año actual). Lo que no se entiende devuelve None.
+
+Es el único lugar donde se interpretan fechas de texto: lo usan `fechas`, el
+tablero de tareas, el selector de fecha y las migraciones. El texto se separa a
+mano (sin `strptime`, que lanza una excepción por cada formato que no
+coincide) y el resultado se memoriza por texto crudo, porque las mismas fechas
+se vuelven a leer en cada redibujado.
+"""
+from __future__ import annotations
+
+from datetime import date
+from functools import lru_cache
+
+CACHE_FECHAS = 4096
+
+
+def parse_fecha(texto: str | None, anio: int | None = None) -> date | None:
+    if not texto:
+        return None
+    if not isinstance(texto, str):
+        texto = str(texto)
+    if anio is None and texto.count("/") == 1:
+        anio = date.today().year
+    return _parsear(texto, anio)
+
+
+def fecha_iso(texto: str | None, anio: int | None = None) -> str | None:
+    """Fecha normalizada AAAA-MM-DD para la columna `tasks.due_date`."""
+    fecha = parse_fecha(texto, anio)
+    return fecha.isoformat() if fecha else None
+
+
+def cache_info():
+    return _parsear.cache_info()
+
+
+@lru_cache(maxsize=CACHE_FECHAS)
+def _parsear(texto: str, anio: int | None) -> date | None:
+    texto = texto.strip()
+    separador = "/" if "/" in texto else "-"
+    partes = texto.split(separador)
+    if not all(parte.isdigit() and parte.isascii() for parte in partes):
+        return None
+
+    if len(partes) == 3:
+        if separador == "-" and len(partes[0]) == 4:
+            anio_texto, mes, dia = partes
+        else:
+            dia, mes, anio_texto = partes
+        if len(anio_texto) == 4:
+            anio = int(anio_texto)
+        elif len(anio_texto) == 2 and separador == "/":
+            # Misma regla que %y: 69-99 son 19xx, 00-68 son 20xx.
+            anio = int(anio_texto)
+            anio += 1900 if anio >= 69 else 2000
+        else:
+            return None
+    elif len(partes) == 2 and separador == "/" and anio is not None:
+        dia, mes = partes
+    else:
+        return None
+
+    if len(dia) > 2 or len(mes) > 2:
+        return None
+    try:
+        return date(anio, int(mes), int(dia))
+    except ValueError:
+        return None
@@ -1,8 +1,179 @@
-import sqlite3, pathlib
+import sqlite3, pathlib, threading, atexit
+from contextlib import contextmanager
+
+import migrations
 
 DB_PATH = pathlib.Path(__file__).with_name("bloc.db")
 
-def get_conn():
-    con = sqlite3.connect(DB_PATH)
+# Una conexión por hilo: se abre la primera vez que el hilo la pide y se
+# reutiliza en las siguientes llamadas a get_conn(). close_all() sube la
+# generación para que los hilos no reutilicen conexiones ya cerradas.
+_local = threading.local()
+_lock = threading.Lock()
+_abiertas: set[sqlite3.Connection] = set()
+_generacion = 0
+_migradas: set[pathlib.Path] = set()
+_stats = {"opens": 0, "reuses": 0, "closes": 0}
+
+# Pragmas que se aplican a cada conexión nueva. Todas usan WAL para que un
+# lector no bloquee mientras se escribe; cambian la durabilidad y la memoria.
+#   safe:        fsync en cada commit (synchronous=FULL).
+#   fast:        fsync solo en los checkpoints de WAL; perfil por defecto.
+#   bulk-import: sin fsync y con caché grande, para cargas masivas puntuales.
+STORAGE_PROFILES = {
+    "safe": {
+        "journal_mode": "WAL",
+        "synchronous": "FULL",
+        "cache_size": -8000,
+        "mmap_size": 0,
+        "temp_store": "DEFAULT",
+        "busy_timeout": 5000,
+    },
+    "fast": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "cache_size": -16000,
+        "mmap_size": 64 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,
+    },
+    "bulk-import": {
+        "journal_mode": "WAL",
+        "synchronous": "OFF",
+        "cache_size": -64000,
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+        "busy_timeout": 10000,
+    },
+}
+_perfil = dict(STORAGE_PROFILES["fast"], name="fast")
+
+
+def set_storage_profile(perfil: str | dict):
+    """Elige el perfil de almacenamiento por nombre o con un dict de pragmas.
+
+    Las conexiones abiertas se cierran para que las siguientes se abran ya
+    con los pragmas nuevos.
+    """
+    global _perfil
+    if isinstance(perfil, str):
+        if perfil not in STORAGE_PROFILES:
+            raise ValueError(f"Perfil de almacenamiento desconocido: {perfil}")
+        nuevo = dict(STORAGE_PROFILES[perfil], name=perfil)
+    else:
+        nuevo = dict(STORAGE_PROFILES["fast"], name="custom")
+        nuevo.update(perfil)
+    close_all()
+    _perfil = nuevo
+
+
+def storage_profile() -> dict:
+    """Perfil activo (incluye la clave `name`)."""
+    return dict(_perfil)
+
+
+def _aplicar_perfil(con: sqlite3.Connection, perfil: dict):
+    for pragma in ("journal_mode", "synchronous", "cache_size", "mmap_size", "temp_store", "busy_timeout"):
+        con.execute(f"PRAGMA {pragma}={perfil[pragma]}")
+
+
+def _abrir() -> sqlite3.Connection:
+    perfil = _perfil
+    # check_same_thread=False solo para poder cerrarla desde close_all();
+    # cada conexión la usa únicamente el hilo que la abrió.
+    con = sqlite3.connect(DB_PATH, timeout=perfil["busy_timeout"] / 1000, check_same_thread=False)
     con.row_factory = sqlite3.Row
+    _aplicar_perfil(con, perfil)
+    if DB_PATH not in _migradas:
+        migrations.migrate(con)
+        with _lock:
+            _migradas.add(DB_PATH)
+    with _lock:
+        _abiertas.add(con)
+        _stats["opens"] += 1
+    return con
+
+
+def _actual() -> sqlite3.Connection | None:
+    con = getattr(_local, "con", None)
+    if con is None:
+        return None
+    if _local.path != DB_PATH or _local.gen != _generacion:
+        release_conn()
+        return None
     return con
+
+
+def get_conn():
+    """Devuelve la conexión del hilo actual, abriéndola si hace falta.
+
+    Se puede seguir usando como `with get_conn() as con:`; el bloque hace
+    commit/rollback pero la conexión queda viva para la siguiente llamada.
+    """
+    con = _actual()
+    if con is not None:
+        with _lock:
+            _stats["reuses"] += 1
+        return con
+    con = _abrir()
+    _local.con, _local.path, _local.gen = con, DB_PATH, _generacion
+    return con
+
+
+@contextmanager
+def connection():
+    """Contexto que hace commit al salir (rollback si hay error) y libera la conexión.
+
+    Si el hilo ya tenía una conexión abierta se reutiliza y queda para el hilo;
+    si el bloque tuvo que abrirla, se cierra al salir.
+    """
+    propia = _actual() is None
+    con = get_conn()
+    try:
+        with con:
+            yield con
+    finally:
+        if propia:
+            release_conn()
+
+
+def release_conn():
+    """Cierra la conexión del hilo actual (útil al terminar un hilo de trabajo)."""
+    con = getattr(_local, "con", None)
+    _local.con = None
+    if con is None:
+        return
+    with _lock:
+        if con not in _abiertas:
+            return
+        _abiertas.discard(con)
+        _stats["closes"] += 1
+    con.close()
+
+
+def close_all():
+    """Cierra las conexiones abiertas por cualquier hilo. Se registra con atexit."""
+    global _generacion
+    with _lock:
+        pendientes = list(_abiertas)
+        _abiertas.clear()
+        _stats["closes"] += len(pendientes)
+        _generacion += 1
+    for con in pendientes:
+        con.close()
+    _local.con = None
+
+
+def conn_stats() -> dict[str, int]:
+    """Contadores de aperturas, reutilizaciones y cierres desde el arranque."""
+    with _lock:
+        return dict(_stats, open_now=len(_abiertas))
+
+
+def reset_conn_stats():
+    with _lock:
+        for clave in _stats:
+            _stats[clave] = 0
+
+
+atexit.register(close_all)
@@ -0,0 +1,192 @@
+"""Hash de contraseñas con algoritmo y costo configurables.
+
+Cada hash guardado lleva su algoritmo y sus parámetros, así se puede subir el
+costo sin invalidar las contraseñas existentes:
+
+    pbkdf2_sha256$<iteraciones>$<salt>$<hash>
+    scrypt$<n>$<r>$<p>$<salt>$<hash>
+
+`verify_password` dice además si el hash quedó viejo (otro algoritmo, costo
+menor o el formato anterior 'salt$hash' de sha256) para que el login lo vuelva
+a generar con el hasher actual. `calibrate` mide la máquina y sugiere el costo
+que tarda `objetivo_ms` por hash.
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import secrets
+import time
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def _unb64(texto: str) -> bytes:
+    return base64.b64decode(texto + "=" * (-len(texto) % 4))
+
+
+class PBKDF2Hasher:
+    algoritmo = "pbkdf2_sha256"
+
+    def __init__(self, iterations: int = 600_000):
+        self.iterations = iterations
+
+    def params(self) -> dict[str, int]:
+        return {"iterations": self.iterations}
+
+    def encode(self, password: str, salt: bytes | None = None) -> str:
+        salt = salt or secrets.token_bytes(16)
+        digest = hashlib.pbkdf2_hmac("sha256", password.encode(), salt, self.iterations)
+        return f"{self.algoritmo}${self.iterations}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        _, iterations, salt, digest = encoded.split("$")
+        calculado = hashlib.pbkdf2_hmac("sha256", password.encode(), _unb64(salt), int(iterations))
+        return hmac.compare_digest(calculado, _unb64(digest))
+
+    def must_update(self, encoded: str) -> bool:
+        return int(encoded.split("$")[1]) < self.iterations
+
+
+class ScryptHasher:
+    algoritmo = "scrypt"
+
+    def __init__(self, n: int = 2**14, r: int = 8, p: int = 1):
+        self.n, self.r, self.p = n, r, p
+
+    def params(self) -> dict[str, int]:
+        return {"n": self.n, "r": self.r, "p": self.p}
+
+    @staticmethod
+    def _derivar(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+        # scrypt usa 128 * n * r bytes; el límite por defecto de OpenSSL (32 MB)
+        # no alcanza para n = 2**15 o más.
+        return hashlib.scrypt(
+            password.encode(), salt=salt, n=n, r=r, p=p, maxmem=256 * n * r + 1024 * 1024, dklen=32
+        )
+
+    def encode(self, password: str, salt: bytes | None = None) -> str:
+        salt = salt or secrets.token_bytes(16)
+        digest = self._derivar(password, salt, self.n, self.r, self.p)
+        return f"{self.algoritmo}${self.n}${self.r}${self.p}${_b64(salt)}${_b64(digest)}"
+
+    def verify(self, password: str, encoded: str) -> bool:
+        _, n, r, p, salt, digest = encoded.split("$")
+        calculado = self._derivar(password, _unb64(salt), int(n), int(r), int(p))
+        return hmac.compare_digest(calculado, _unb64(digest))
+
+    def must_update(self, encoded: str) -> bool:
+        _, n, r, p, *_ = encoded.split("$")
+        return (int(n), int(r), int(p)) != (self.n, self.r, self.p)
+
+
+class LegacySha256Hasher:
+    """Formato anterior 'salt$hash': un solo sha256 de salt + contraseña.
+
+    Solo verifica; nunca se usa para guardar contraseñas nuevas.
+    """
+    algoritmo = "sha256"
+
+    @staticmethod
+    def matches(encoded: str) -> bool:
+        partes = encoded.split("$")
+        return len(partes) == 2 and len(partes[1]) == 64
+
+    def verify(self, password: str, encoded: str) -> bool:
+        salt, digest = encoded.split("$")
+        calculado = hashlib.sha256((salt + password).encode()).hexdigest()
+        return hmac.compare_digest(calculado, digest)
+
+    def must_update(self, encoded: str) -> bool:
+        return True
+
+
+HASHERS = {
+    PBKDF2Hasher.algoritmo: PBKDF2Hasher(),
+    ScryptHasher.algoritmo: ScryptHasher(),
+}
+_LEGACY = LegacySha256Hasher()
+_preferido = PBKDF2Hasher.algoritmo
+
+
+def set_hasher(nombre: str, **params):
+    """Elige el algoritmo con el que se guardan las contraseñas y su costo.
+
+    Los hashes con otro algoritmo o costo menor se rehacen en el siguiente
+    login correcto.
+    """
+    global _preferido
+    if nombre not in HASHERS:
+        raise ValueError(f"hasher desconocido: {nombre!r} (opciones: {', '.join(HASHERS)})")
+    if params:
+        HASHERS[nombre] = type(HASHERS[nombre])(**params)
+    _preferido = nombre
+
+
+def current_hasher():
+    return HASHERS[_preferido]
+
+
+def identify(encoded: str):
+    """Hasher que generó `encoded`, o None si no tiene un formato conocido."""
+    if not encoded:
+        return None
+    hasher = HASHERS.get(encoded.split("$", 1)[0])
+    if hasher is not None:
+        return hasher
+    return _LEGACY if _LEGACY.matches(encoded) else None
+
+
+def hash_password(password: str) -> str:
+    return current_hasher().encode(password)
+
+
+def verify_password(password: str, encoded: str) -> tuple[bool, bool]:
+    """Devuelve `(ok, rehacer)`: si la contraseña coincide y si el hash guardado
+    debe regenerarse con el hasher actual."""
+    hasher = identify(encoded)
+    if hasher is None:
+        return False, False
+    try:
+        ok = hasher.verify(password, encoded)
+    except (ValueError, TypeError):
+        return False, False
+    if not ok:
+        return False, False
+    rehacer = hasher is not current_hasher() or hasher.must_update(encoded)
+    return True, rehacer
+
+
+def calibrate(nombre: str = PBKDF2Hasher.algoritmo, objetivo_ms: float = 250.0) -> dict[str, int]:
+    """Parámetros de `nombre` con los que un hash tarda ~`objetivo_ms` aquí.
+
+    PBKDF2 escala lineal con las iteraciones: se mide una corrida corta y se
+    extrapola. En scrypt se duplica `n` (debe ser potencia de 2) mientras
+    quepa en el objetivo.
+    """
+    if nombre == PBKDF2Hasher.algoritmo:
+        iteraciones = 50_000
+        while True:
+            inicio = time.perf_counter()
+            PBKDF2Hasher(iteraciones).encode("calibracion")
+            ms = (time.perf_counter() - inicio) * 1000
+            if ms >= 50:
+                break
+            iteraciones *= 2
+        return {"iterations": max(10_000, int(iteraciones * objetivo_ms / ms) // 1000 * 1000)}
+
+    if nombre == ScryptHasher.algoritmo:
+        n = 2**12
+        while True:
+            inicio = time.perf_counter()
+            ScryptHasher(n * 2).encode("calibracion")
+            ms = (time.perf_counter() - inicio) * 1000
+            if ms > objetivo_ms or n >= 2**20:
+                break
+            n *= 2
+        return {"n": n, "r": 8, "p": 1}
+
+    raise ValueError(f"hasher desconocido: {nombre!r}")
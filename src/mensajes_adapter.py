@@ -1,8 +1,10 @@
 """
 Adaptador de mensajes para 3°.
 
-- Si el paquete `mensajes` (de 1°) está disponible, usa sus claves y su función t().
-- Si no, usa un FALBACK local con las claves mínimas para la demo/CLI.
+- Los textos están en src/locales/<idioma>.json; el idioma inicial sale de la
+  variable ABHUB_LOCALE (por defecto "es") y se cambia con usar_locale().
+- Cada catálogo se compila al cargarlo: t() sin argumentos es una búsqueda en
+  un dict y con argumentos llama a un formateador ya ligado a la plantilla.
 
 Uso:
     from mensajes_adapter import t
@@ -11,38 +13,98 @@ Uso:
     print(t("task_list_header"))
 """
 
-from typing import Dict, Tuple, List
-
-_T_EXTERN = None
-_CATALOGO: Dict[str, str] = {}
-
-try:
-    from mensajes import t as _T_EXTERN, MENSAJES as _CATALOGO
-except Exception:
-    _CATALOGO = {
-        "auth_ok": "Inicio de sesión correcto",
-        "auth_fail": "Usuario o contraseña no válidos",
-        "user_exists": "El usuario ya existe",
-        "invalid_input": "Datos incompletos o inválidos",
-
-        "task_added": "Tarea agregada",
-        "task_updated": "Tarea actualizada",
-        "task_marked_done": "Tarea marcada como hecha",
-        "task_not_found": "No se encontró la tarea",
-        "task_list_header": "Tus tareas:",
-
-        "unexpected_error": "Ocurrió un error inesperado",
-        "db_error": "Error de base de datos",
-        "due_date_invalid": "La fecha no es válida (usa DD/MM)",
-        "password_weak": "La contraseña es débil",
-    }
-
-    def _T_EXTERN(clave: str, **kv) -> str:
-        base = _CATALOGO.get(clave, clave)
+import json
+import os
+import threading
+from pathlib import Path
+from string import Formatter
+from typing import Callable, Dict, Iterable, List, Tuple
+
+# Un JSON por idioma en src/locales (es.json, en.json, ...). Solo se lee el de
+# un idioma la primera vez que se usa; las claves que le falten se toman de
+# LOCALE_BASE.
+LOCALES_DIR = Path(__file__).with_name("locales")
+LOCALE_BASE = "es"
+
+_compilados: Dict[str, tuple] = {}
+_lock = threading.RLock()
+
+
+def _compilar(catalogo: Dict[str, str]):
+    """Analiza cada plantilla una vez con string.Formatter().parse.
+
+    Devuelve (textos, formatos, claves): `textos` es la plantilla tal cual
+    (lo que t() devuelve sin argumentos); `formatos` tiene un formateador ya
+    ligado para las que llevan campos, o el texto ya resuelto para las que
+    solo tienen llaves escapadas; `claves` es un frozenset para ensure().
+    """
+    textos: Dict[str, str] = {}
+    formatos: Dict[str, Callable[[dict], str]] = {}
+    for clave, base in catalogo.items():
+        base = str(base)
+        textos[clave] = base
         try:
-            return base.format(**kv) if kv else base
-        except Exception:
-            return base
+            partes = list(_FORMATTER.parse(base))
+        except ValueError:
+            continue
+        if any(campo is not None for _, campo, _, _ in partes):
+            formatos[clave] = base.format_map
+        else:
+            literal = "".join(texto for texto, _, _, _ in partes)
+            if literal != base:
+                formatos[clave] = lambda kv, literal=literal: literal
+    return textos, formatos, frozenset(textos)
+
+
+_FORMATTER = Formatter()
+
+
+def _leer_bundle(locale: str) -> Dict[str, str]:
+    try:
+        with open(LOCALES_DIR / f"{locale}.json", encoding="utf-8") as archivo:
+            return json.load(archivo)
+    except (OSError, ValueError) as e:
+        print(f"Error leyendo los mensajes '{locale}':", e)
+        return {}
+
+
+def _catalogo(locale: str) -> tuple:
+    """Catálogo compilado de `locale`, leído y guardado la primera vez."""
+    compilado = _compilados.get(locale)
+    if compilado is not None:
+        return compilado
+    with _lock:
+        if locale not in _compilados:
+            mensajes = _leer_bundle(locale)
+            if locale != LOCALE_BASE:
+                mensajes = {**_catalogo(LOCALE_BASE)[0], **mensajes}
+            _compilados[locale] = _compilar(mensajes)
+        return _compilados[locale]
+
+
+def locales_disponibles() -> List[str]:
+    """Idiomas con bundle en LOCALES_DIR (no los lee)."""
+    return sorted(ruta.stem for ruta in LOCALES_DIR.glob("*.json"))
+
+
+def locale_actual() -> str:
+    return _LOCALE
+
+
+def usar_locale(locale: str):
+    """Cambia el idioma de t(); lo carga si es la primera vez."""
+    global _LOCALE, _TEXTOS, _FORMATOS, _CLAVES, _LISTA_CLAVES
+    textos, formatos, claves = _catalogo(locale)
+    _LOCALE = locale
+    _TEXTOS, _FORMATOS, _CLAVES, _LISTA_CLAVES = textos, formatos, claves, tuple(textos)
+
+
+_LOCALE = LOCALE_BASE
+_TEXTOS: Dict[str, str] = {}
+_FORMATOS: Dict[str, Callable[[dict], str]] = {}
+_CLAVES: frozenset = frozenset()
+_LISTA_CLAVES: Tuple[str, ...] = ()
+usar_locale(os.environ.get("ABHUB_LOCALE") or LOCALE_BASE)
 
 
 def t(clave: str, **kv) -> str:
@@ -50,30 +112,33 @@ def t(clave: str, **kv) -> str:
     Devuelve el texto asociado a `clave`. Soporta placeholders con **kv.
     Ej: t("task_added"); t("greeting", nombre="Ana") -> "Hola Ana"
     """
-    try:
-        return _T_EXTERN(clave, **kv)
-    except Exception:
-        base = _CATALOGO.get(clave, clave)
-        try:
-            return base.format(**kv) if kv else base
-        except Exception:
-            return base
+    if kv:
+        formato = _FORMATOS.get(clave)
+        if formato is not None:
+            try:
+                return formato(kv)
+            except (KeyError, IndexError, ValueError, AttributeError, TypeError):
+                pass
+    return _TEXTOS.get(clave, clave)
 
 
-def keys() -> List[str]:
-    """Lista de claves de mensaje disponibles."""
-    return list(_CATALOGO.keys())
+def keys() -> Tuple[str, ...]:
+    """Claves de mensaje disponibles."""
+    return _LISTA_CLAVES
 
 
 def has_key(clave: str) -> bool:
     """True si la clave existe en el catálogo actual."""
-    return clave in _CATALOGO
+    return clave in _CLAVES
 
 
-def ensure(required: List[str]) -> Tuple[bool, List[str]]:
+def ensure(required: Iterable[str]) -> Tuple[bool, List[str]]:
     """
     Verifica que existan todas las claves requeridas.
     Retorna (ok, faltantes).
     """
-    faltantes = [k for k in required if k not in _CATALOGO]
+    required = list(required)
+    if _CLAVES.issuperset(required):
+        return True, []
+    faltantes = [k for k in required if k not in _CLAVES]
     return (len(faltantes) == 0, faltantes)
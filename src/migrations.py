@@ -0,0 +1,183 @@
+"""Migraciones versionadas de bloc.db.
+
+La versión del esquema se guarda en `PRAGMA user_version`. Cada migración
+sube la versión en uno; `migrate()` aplica las pendientes dentro de una sola
+transacción, así una base vieja se actualiza en el lugar al abrirla.
+`semillas.sql` debe describir siempre el esquema de la última versión.
+"""
+import sqlite3
+from datetime import datetime
+
+import hashers
+from date_parser import fecha_iso
+
+
+def _v1_esquema_base(con: sqlite3.Connection):
+    con.execute(
+        """
+        create table if not exists usuarios (
+          id         integer primary key autoincrement,
+          correo     text unique not null,
+          contrasena text not null,
+          nombre     text
+        )
+        """
+    )
+    con.execute(
+        """
+        create table if not exists tasks (
+          id         integer primary key autoincrement,
+          usuario    text not null,
+          texto      text not null,
+          fecha      text not null,
+          done       integer not null default 0,
+          created_at real not null default (strftime('%s','now'))
+        )
+        """
+    )
+
+
+def _v2_indices_tasks(con: sqlite3.Connection):
+    # listar_tareas filtra por usuario y ordena por id DESC.
+    con.execute("create index if not exists idx_tasks_usuario_id on tasks(usuario, id desc)")
+    con.execute("create index if not exists idx_tasks_usuario_done_fecha on tasks(usuario, done, fecha)")
+
+
+def _v3_due_date(con: sqlite3.Connection):
+    # `fecha` queda como la escribió el usuario; `due_date` es AAAA-MM-DD (o NULL
+    # si no se pudo leer) y es la que se usa para filtrar y ordenar en SQL.
+    # Las fechas sin año (DD/MM) toman el año en que se creó la tarea.
+    con.execute("alter table tasks add column due_date text")
+    filas = con.execute("select id, fecha, created_at from tasks").fetchall()
+    cambios = []
+    for tarea_id, fecha, creada in filas:
+        anio = datetime.fromtimestamp(creada).year if creada else None
+        iso = fecha_iso(fecha, anio)
+        if iso:
+            cambios.append((iso, tarea_id))
+    con.executemany("update tasks set due_date=? where id=?", cambios)
+    con.execute("create index if not exists idx_tasks_usuario_due on tasks(usuario, due_date)")
+
+
+def _v4_login_fallos(con: sqlite3.Connection):
+    # Fallos de login recientes, para que el límite de intentos sobreviva a un
+    # reinicio. Solo se usa si auth_service.configurar_limites(persistir=True).
+    con.execute(
+        """
+        create table if not exists login_fallos (
+          clave   text not null,
+          momento real not null
+        )
+        """
+    )
+    con.execute("create index if not exists idx_login_fallos_clave on login_fallos(clave, momento)")
+
+
+def _v5_usuario_id(con: sqlite3.Connection):
+    # Las tareas se refieren al usuario por id. `usuario` (el correo) se sigue
+    # guardando para no romper herramientas viejas, pero ya no se consulta: sus
+    # índices se reemplazan por los mismos sobre usuario_id.
+    con.execute("alter table tasks add column usuario_id integer references usuarios(id)")
+    con.execute("update tasks set usuario_id = (select u.id from usuarios u where u.correo = tasks.usuario)")
+    for indice in ("idx_tasks_usuario_id", "idx_tasks_usuario_done_fecha", "idx_tasks_usuario_due"):
+        con.execute(f"drop index if exists {indice}")
+    con.execute("create index if not exists idx_tasks_uid_id on tasks(usuario_id, id desc)")
+    con.execute("create index if not exists idx_tasks_uid_done_fecha on tasks(usuario_id, done, fecha)")
+    con.execute("create index if not exists idx_tasks_uid_due on tasks(usuario_id, due_date)")
+
+
+def _v6_reminders(con: sqlite3.Connection):
+    # Recordatorios que dispara scheduler.py. `vence_en` y `enviado_en` son
+    # time.time(); los pendientes son los que no tienen enviado_en.
+    con.execute(
+        """
+        create table if not exists reminders (
+          id         integer primary key autoincrement,
+          usuario_id integer references usuarios(id),
+          task_id    integer references tasks(id) on delete cascade,
+          titulo     text not null,
+          mensaje    text not null,
+          vence_en   real not null,
+          enviado_en real
+        )
+        """
+    )
+    con.execute(
+        "create index if not exists idx_reminders_pendientes on reminders(vence_en) where enviado_en is null"
+    )
+
+
+def _v7_por_vencer(con: sqlite3.Connection):
+    # Vencimientos pendientes de todos los usuarios, en orden de fecha. SQLite
+    # mantiene el índice en cada escritura de tasks; lo usa tareas_por_vencer().
+    con.execute(
+        "create index if not exists idx_tasks_por_vencer on tasks(due_date, usuario_id, id) "
+        "where done = 0 and due_date is not null"
+    )
+
+
+def _v8_hashear_texto_plano(con: sqlite3.Connection):
+    # Las bases más viejas guardaban la contraseña tal cual. Se reemplazan por
+    # su hash con el hasher actual, así el login ya no acepta texto plano.
+    # Cuesta un hash por cuenta, una sola vez.
+    filas = con.execute("SELECT id, contrasena FROM usuarios").fetchall()
+    con.executemany(
+        "UPDATE usuarios SET contrasena=? WHERE id=?",
+        [
+            (hashers.hash_password(contrasena or ""), usuario_id)
+            for usuario_id, contrasena in filas
+            if hashers.identify(contrasena) is None
+        ],
+    )
+
+
+def _v9_ajustes(con: sqlite3.Connection):
+    # Ajustes de la instalación como clave -> JSON. Por ahora "hasher", que
+    # guarda tools/calibrar_hash.py --guardar y aplica la app al arrancar.
+    con.execute(
+        """
+        create table if not exists ajustes (
+          clave text primary key,
+          valor text not null
+        )
+        """
+    )
+
+
+MIGRATIONS = [
+    _v1_esquema_base,
+    _v2_indices_tasks,
+    _v3_due_date,
+    _v4_login_fallos,
+    _v5_usuario_id,
+    _v6_reminders,
+    _v7_por_vencer,
+    _v8_hashear_texto_plano,
+    _v9_ajustes,
+]
+
+LATEST_VERSION = len(MIGRATIONS)
+
+
+def current_version(con: sqlite3.Connection) -> int:
+    return con.execute("PRAGMA user_version").fetchone()[0]
+
+
+def migrate(con: sqlite3.Connection) -> int:
+    """Aplica las migraciones pendientes y devuelve la versión final."""
+    if current_version(con) >= LATEST_VERSION:
+        return current_version(con)
+    if con.in_transaction:
+        con.commit()
+    con.execute("BEGIN IMMEDIATE")
+    try:
+        # Se vuelve a leer ya con el candado tomado por si otro hilo migró antes.
+        version = current_version(con)
+        for numero, migracion in enumerate(MIGRATIONS[version:], start=version + 1):
+            migracion(con)
+            con.execute(f"PRAGMA user_version={numero}")
+        con.commit()
+    except Exception:
+        con.rollback()
+        raise
+    return current_version(con)
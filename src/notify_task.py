@@ -1,7 +1,12 @@
 import argparse
+import logging
+import queue
 import sys
+import threading
 import time
 
+log = logging.getLogger("abhub.recordatorios")
+
 
 def notify_windows(title: str, message: str):
     try:
@@ -19,6 +24,148 @@ def notify_windows(title: str, message: str):
         return False
 
 
+def notify_log(title: str, message: str):
+    log.info("%s: %s", title, message)
+    return True
+
+
+def notify_stdout(title: str, message: str):
+    print(f"[{time.strftime('%H:%M:%S')}] {title}: {message}", flush=True)
+    return True
+
+
+# Backends que puede usar scheduler.py. Un notifier recibe (titulo, mensaje) y
+# devuelve True si pudo avisar.
+NOTIFIERS = {
+    "windows": notify_windows,
+    "log": notify_log,
+    "stdout": notify_stdout,
+}
+
+
+def default_notifier():
+    return NOTIFIERS["windows"] if sys.platform == "win32" else NOTIFIERS["log"]
+
+
+_FIN = object()
+
+
+class NotificationQueue:
+    """Cola de avisos que se entregan en segundo plano, agrupados.
+
+    Se usa como notifier (recibe titulo y mensaje): encola y vuelve enseguida.
+    Un hilo toma el primer aviso, junta los que lleguen en los `ventana`
+    segundos siguientes y entrega un solo resumen por el backend. Si la cola
+    (de `max_cola` avisos) está llena, el aviso no se pierde: se suma como
+    "y N más" al siguiente resumen, porque el despachador ya lo marcó enviado.
+    """
+
+    def __init__(self, backend=None, ventana: float = 10.0, max_cola: int = 256, max_lista: int = 5):
+        self.backend = backend or default_notifier()
+        self.ventana = ventana
+        self.max_lista = max_lista
+        self._cola: queue.Queue = queue.Queue(maxsize=max_cola)
+        self._lock = threading.Lock()
+        self._stats: dict[str, dict] = {}
+        self._desbordados = 0
+        self._hilo = threading.Thread(target=self._bucle, name="abhub-notify", daemon=True)
+        self._hilo.start()
+
+    def __call__(self, title: str, message: str) -> bool:
+        # Con el candado tomado: si la cola está llena, el hilo todavía no sacó
+        # esos avisos y el resumen que los entregue ya verá este conteo.
+        with self._lock:
+            try:
+                self._cola.put_nowait((title, message, time.monotonic()))
+            except queue.Full:
+                self._desbordados += 1
+        return True
+
+    def close(self, timeout: float | None = 15.0):
+        """Entrega lo pendiente y termina el hilo."""
+        self._cola.put(_FIN)
+        self._hilo.join(timeout)
+
+    def stats(self) -> dict[str, dict]:
+        """Por backend: avisos y resúmenes entregados, avisos que no cupieron en
+        la cola (van en el resumen como "y N más"), fallidos,
+        latencia desde que se encoló y duración de las llamadas al backend."""
+        with self._lock:
+            resultado = {}
+            for nombre, datos in self._stats.items():
+                datos = dict(datos)
+                if datos["notifications"]:
+                    datos["avg_call_ms"] = datos["busy_s"] * 1000 / datos["notifications"]
+                    datos["notifications_per_s"] = datos["notifications"] / datos["busy_s"] if datos["busy_s"] else None
+                if datos["items"]:
+                    datos["avg_latency_ms"] = datos["latency_s"] * 1000 / datos["items"]
+                resultado[nombre] = datos
+            return resultado
+
+    def _contar(self, **valores):
+        nombre = getattr(self.backend, "__name__", repr(self.backend))
+        with self._lock:
+            datos = self._stats.setdefault(nombre, {
+                "items": 0, "notifications": 0, "overflowed": 0, "failed": 0,
+                "busy_s": 0.0, "latency_s": 0.0, "max_latency_ms": 0.0,
+            })
+            for clave, valor in valores.items():
+                if clave == "max_latency_ms":
+                    datos[clave] = max(datos[clave], valor)
+                else:
+                    datos[clave] += valor
+
+    def _bucle(self):
+        terminar = False
+        while not terminar:
+            primero = self._cola.get()
+            if primero is _FIN:
+                return
+            grupo = [primero]
+            limite = primero[2] + self.ventana
+            while True:
+                try:
+                    siguiente = self._cola.get(timeout=max(0.0, limite - time.monotonic()))
+                except queue.Empty:
+                    break
+                if siguiente is _FIN:
+                    terminar = True
+                    break
+                grupo.append(siguiente)
+            self._entregar(grupo)
+
+    def _resumen(self, grupo, extra: int = 0) -> tuple[str, str]:
+        total = len(grupo) + extra
+        if total == 1:
+            return grupo[0][0], grupo[0][1]
+        lineas = [f"- {titulo}: {mensaje}" for titulo, mensaje, _ in grupo[:self.max_lista]]
+        if total > len(lineas):
+            lineas.append(f"... y {total - len(lineas)} más")
+        return f"{total} recordatorios", "\n".join(lineas)
+
+    def _entregar(self, grupo):
+        with self._lock:
+            extra, self._desbordados = self._desbordados, 0
+        title, message = self._resumen(grupo, extra)
+        inicio = time.monotonic()
+        try:
+            ok = bool(self.backend(title, message))
+        except Exception as exc:
+            print("Error enviando aviso:", exc)
+            ok = False
+        fin = time.monotonic()
+        latencias = [fin - encolado for _, _, encolado in grupo]
+        self._contar(
+            items=len(grupo),
+            overflowed=extra,
+            notifications=1,
+            failed=0 if ok else 1,
+            busy_s=fin - inicio,
+            latency_s=sum(latencias),
+            max_latency_ms=max(latencias) * 1000,
+        )
+
+
 def main(argv=None):
     parser = argparse.ArgumentParser()
     parser.add_argument('--title', default='Recordatorio')
@@ -0,0 +1,108 @@
+"""Límite de intentos fallidos con ventana deslizante.
+
+Cada clave (por ejemplo "correo:ana@ucol.mx") guarda los momentos de sus
+fallos recientes; mientras tenga `max_fallos` dentro de la ventana queda
+bloqueada. Usa la hora de pared (time.time) para que los fallos guardados en la
+base sigan valiendo después de reiniciar la app.
+
+Se guardan a lo sumo `max_claves` claves. Al llegar al tope se quitan las que
+ya no tienen fallos en la ventana y, si no alcanza, las de fallo más viejo que
+todavía no están bloqueadas (el dict se mantiene en orden del último fallo).
+Una clave bloqueada nunca se suelta antes de tiempo: si solo quedan bloqueadas,
+el limitador queda saturado y falla cerrado, es decir, las claves que no
+conoce se tratan como bloqueadas hasta que se libere lugar.
+"""
+import threading
+import time
+from collections import deque
+
+
+class SlidingWindowLimiter:
+    def __init__(self, max_fallos: int = 5, ventana: float = 300.0, max_claves: int = 10_000):
+        self.max_fallos = max_fallos
+        self.ventana = ventana
+        self.max_claves = max_claves
+        self._fallos: dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._stats = {"blocked": 0, "failures": 0, "resets": 0, "evicted": 0, "refused": 0}
+        self._saturado = False
+        self._ultima_purga = 0.0
+
+    def _recientes(self, clave: str, ahora: float) -> deque | None:
+        fallos = self._fallos.get(clave)
+        if fallos is None:
+            return None
+        while fallos and fallos[0] <= ahora - self.ventana:
+            fallos.popleft()
+        if not fallos:
+            del self._fallos[clave]
+            return None
+        return fallos
+
+    def allowed(self, clave: str) -> bool:
+        with self._lock:
+            ahora = time.time()
+            fallos = self._recientes(clave, ahora)
+            if fallos is not None and len(fallos) >= self.max_fallos:
+                self._stats["blocked"] += 1
+                return False
+            if fallos is None and self._saturado:
+                # Como mucho una purga por segundo mientras dure la saturación.
+                if ahora - self._ultima_purga >= 1.0:
+                    self._saturado = not self._hacer_lugar(ahora)
+                if self._saturado:
+                    self._stats["blocked"] += 1
+                    return False
+            return True
+
+    def retry_after(self, clave: str) -> float:
+        """Segundos hasta que la clave vuelva a estar permitida (0 si ya lo está)."""
+        with self._lock:
+            ahora = time.time()
+            fallos = self._recientes(clave, ahora)
+            if fallos is None or len(fallos) < self.max_fallos:
+                return 0.0
+            return fallos[-self.max_fallos] + self.ventana - ahora
+
+    def record_failure(self, clave: str, momento: float | None = None):
+        with self._lock:
+            fallos = self._fallos.pop(clave, None)
+            if fallos is None:
+                if len(self._fallos) >= self.max_claves:
+                    self._saturado = not self._hacer_lugar(time.time())
+                    if self._saturado:
+                        self._stats["refused"] += 1
+                        return
+                fallos = deque(maxlen=self.max_fallos)
+            self._fallos[clave] = fallos
+            fallos.append(momento or time.time())
+            self._stats["failures"] += 1
+
+    def reset(self, clave: str):
+        with self._lock:
+            if self._fallos.pop(clave, None) is not None:
+                self._stats["resets"] += 1
+
+    def _hacer_lugar(self, ahora: float) -> bool:
+        """Purga las claves vencidas y, si hace falta, suelta las más viejas que
+        no están bloqueadas. Devuelve True si queda lugar para una clave nueva."""
+        self._ultima_purga = ahora
+        for clave in list(self._fallos):
+            self._recientes(clave, ahora)
+        # Si todas siguen vigentes (por ejemplo, alguien probando correos al
+        # azar) se deja lugar para un 10% más, así no se recorre todo el dict
+        # en cada fallo nuevo.
+        sobran = len(self._fallos) - self.max_claves * 9 // 10
+        if sobran > 0:
+            libres = [clave for clave, fallos in self._fallos.items() if len(fallos) < self.max_fallos]
+            for clave in libres[:sobran]:
+                del self._fallos[clave]
+            self._stats["evicted"] += min(sobran, len(libres))
+        return len(self._fallos) < self.max_claves
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._stats, keys=len(self._fallos), saturated=self._saturado)
+
+    def __len__(self):
+        return len(self._fallos)
@@ -0,0 +1,195 @@
+"""Despachador de recordatorios en un solo proceso.
+
+Los recordatorios viven en la tabla `reminders` de bloc.db. El despachador
+tiene en memoria un heap con los próximos (por `vence_en`) y un hilo que
+duerme en una `threading.Condition` hasta que vence el primero, o hasta que
+`programar()` agrega uno que vence antes. Sin recordatorios cerca el hilo no
+hace nada; cada `refresco` segundos vuelve a leer de la base los que vencen
+pronto, así ve también los que agregó otro proceso.
+
+Antes de avisar, cada recordatorio se marca como enviado con un UPDATE
+condicionado: si dos procesos lo tienen en cola, solo uno lo envía.
+
+Los avisos pasan por una `NotificationQueue` (notify_task.py): el hilo del
+despachador no espera al toast, y los que vencen dentro de `--ventana`
+segundos llegan juntos en un solo resumen.
+
+    python src/scheduler.py --notifier stdout --ventana 5
+"""
+from __future__ import annotations
+
+import argparse
+import heapq
+import threading
+import time
+
+from db import get_conn
+from notify_task import NOTIFIERS, NotificationQueue, default_notifier
+
+
+class ReminderScheduler:
+    def __init__(self, notifier=None, refresco: float | None = 60.0):
+        self.notifier = notifier or default_notifier()
+        self.refresco = refresco
+        self._heap: list[tuple[float, int, str, str]] = []
+        self._en_cola: set[int] = set()
+        self._cond = threading.Condition()
+        self._hilo: threading.Thread | None = None
+        self._activo = False
+        self._stats = {"scheduled": 0, "sent": 0, "failed": 0, "skipped": 0, "wakeups": 0, "reloads": 0}
+
+    # --- API -----------------------------------------------------------------
+    def start(self):
+        with self._cond:
+            if self._activo:
+                return
+            self._activo = True
+        self._recargar()
+        self._hilo = threading.Thread(target=self._bucle, name="abhub-reminders", daemon=True)
+        self._hilo.start()
+
+    def stop(self, timeout: float | None = 5.0):
+        with self._cond:
+            self._activo = False
+            self._cond.notify()
+        if self._hilo is not None:
+            self._hilo.join(timeout)
+            self._hilo = None
+
+    def programar(self, titulo: str, mensaje: str, cuando: float,
+                  usuario_id: int | None = None, task_id: int | None = None) -> int:
+        """Guarda un recordatorio para `cuando` (time.time()) y devuelve su id."""
+        with get_conn() as con:
+            reminder_id = con.execute(
+                "INSERT INTO reminders(usuario_id, task_id, titulo, mensaje, vence_en) VALUES(?,?,?,?,?)",
+                (usuario_id, task_id, titulo, mensaje, cuando),
+            ).lastrowid
+        with self._cond:
+            self._stats["scheduled"] += 1
+            self._encolar(cuando, reminder_id, titulo, mensaje)
+        return reminder_id
+
+    def cancelar(self, reminder_id: int) -> bool:
+        """Borra un recordatorio pendiente. Si estaba en el heap se descarta
+        al llegar a la cabeza."""
+        with get_conn() as con:
+            borrados = con.execute(
+                "DELETE FROM reminders WHERE id=? AND enviado_en IS NULL", (reminder_id,)
+            ).rowcount
+        with self._cond:
+            self._en_cola.discard(reminder_id)
+        return borrados > 0
+
+    def pendientes(self) -> int:
+        with self._cond:
+            return len(self._en_cola)
+
+    def stats(self) -> dict[str, int]:
+        with self._cond:
+            return dict(self._stats, queued=len(self._en_cola))
+
+    # --- Interno ---------------------------------------------------------------
+    def _encolar(self, cuando: float, reminder_id: int, titulo: str, mensaje: str):
+        # Se llama con self._cond tomado.
+        if reminder_id in self._en_cola:
+            return
+        self._en_cola.add(reminder_id)
+        heapq.heappush(self._heap, (cuando, reminder_id, titulo, mensaje))
+        if self._heap[0][1] == reminder_id:
+            self._cond.notify()
+
+    def _recargar(self):
+        """Trae de la base los pendientes que vencen antes del próximo refresco
+        (todos si no hay refresco)."""
+        sql = "SELECT id, titulo, mensaje, vence_en FROM reminders WHERE enviado_en IS NULL"
+        params: tuple = ()
+        if self.refresco is not None:
+            sql += " AND vence_en <= ?"
+            params = (time.time() + 2 * self.refresco,)
+        filas = get_conn().execute(sql, params).fetchall()
+        with self._cond:
+            self._stats["reloads"] += 1
+            for fila in filas:
+                self._encolar(fila["vence_en"], fila["id"], fila["titulo"], fila["mensaje"])
+
+    def _bucle(self):
+        proximo_refresco = time.monotonic() + (self.refresco or float("inf"))
+        while True:
+            with self._cond:
+                while self._activo:
+                    ahora = time.time()
+                    if self._heap and self._heap[0][0] <= ahora:
+                        break
+                    espera = proximo_refresco - time.monotonic()
+                    if self._heap:
+                        espera = min(espera, self._heap[0][0] - ahora)
+                    if espera <= 0:
+                        break
+                    self._cond.wait(None if espera == float("inf") else espera)
+                    self._stats["wakeups"] += 1
+                if not self._activo:
+                    return
+                vencidos = []
+                ahora = time.time()
+                while self._heap and self._heap[0][0] <= ahora:
+                    _, reminder_id, titulo, mensaje = heapq.heappop(self._heap)
+                    if reminder_id in self._en_cola:
+                        self._en_cola.discard(reminder_id)
+                        vencidos.append((reminder_id, titulo, mensaje))
+            if vencidos:
+                self._despachar(vencidos)
+            if self.refresco is not None and time.monotonic() >= proximo_refresco:
+                proximo_refresco = time.monotonic() + self.refresco
+                try:
+                    self._recargar()
+                except Exception as exc:
+                    print("Error leyendo recordatorios:", exc)
+
+    def _despachar(self, vencidos: list[tuple[int, str, str]]):
+        try:
+            with get_conn() as con:
+                propios = []
+                for reminder_id, titulo, mensaje in vencidos:
+                    tomado = con.execute(
+                        "UPDATE reminders SET enviado_en=? WHERE id=? AND enviado_en IS NULL",
+                        (time.time(), reminder_id),
+                    ).rowcount
+                    if tomado:
+                        propios.append((titulo, mensaje))
+        except Exception as exc:
+            print("Error marcando recordatorios:", exc)
+            return
+        with self._cond:
+            self._stats["skipped"] += len(vencidos) - len(propios)
+        for titulo, mensaje in propios:
+            try:
+                ok = self.notifier(titulo, mensaje)
+            except Exception as exc:
+                print("Error enviando recordatorio:", exc)
+                ok = False
+            with self._cond:
+                self._stats["sent" if ok else "failed"] += 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Envía los recordatorios de bloc.db a su hora.")
+    parser.add_argument("--notifier", choices=sorted(NOTIFIERS), default=None)
+    parser.add_argument("--refresco", type=float, default=60.0)
+    parser.add_argument("--ventana", type=float, default=10.0,
+                        help="segundos para juntar avisos en un resumen")
+    args = parser.parse_args(argv)
+
+    avisos = NotificationQueue(NOTIFIERS[args.notifier] if args.notifier else None, ventana=args.ventana)
+    scheduler = ReminderScheduler(avisos, refresco=args.refresco)
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        scheduler.stop()
+        avisos.close()
+        print(avisos.stats())
+
+
+if __name__ == "__main__":
+    main()
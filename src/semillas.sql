@@ -1,5 +1,11 @@
 pragma foreign_keys = on;
 
+-- Esquema de la última versión de migrations.py. Las bases existentes se
+-- actualizan solas al abrirse; este script es para crear una desde cero.
+
+drop table if exists ajustes;
+drop table if exists reminders;
+drop table if exists login_fallos;
 drop table if exists tasks;
 drop table if exists usuarios;
 
@@ -11,11 +17,44 @@ create table if not exists usuarios (
 );
 
 create table if not exists tasks (
-  id             integer primary key autoincrement,
-  usuario_id     integer not null,
-  texto          text not null,
-  fecha          text not null,
-  done           integer not null default 0,
-  created_at     real not null default (strftime('%s','now')),
-  foreign key (usuario_id) references usuarios(id) on delete cascade
+  id         integer primary key autoincrement,
+  usuario    text not null,    -- correo del dueño; se conserva, las consultas usan usuario_id
+  texto      text not null,
+  fecha      text not null,
+  done       integer not null default 0,
+  created_at real not null default (strftime('%s','now')),
+  due_date   text,             -- AAAA-MM-DD normalizada desde `fecha`
+  usuario_id integer references usuarios(id)
 );
+
+create index if not exists idx_tasks_uid_id on tasks(usuario_id, id desc);
+create index if not exists idx_tasks_uid_done_fecha on tasks(usuario_id, done, fecha);
+create index if not exists idx_tasks_uid_due on tasks(usuario_id, due_date);
+create index if not exists idx_tasks_por_vencer on tasks(due_date, usuario_id, id)
+  where done = 0 and due_date is not null;
+
+create table if not exists login_fallos (
+  clave   text not null,     -- "correo:<correo>" u "origen:<origen>"
+  momento real not null      -- time.time() del intento fallido
+);
+
+create index if not exists idx_login_fallos_clave on login_fallos(clave, momento);
+
+create table if not exists reminders (
+  id         integer primary key autoincrement,
+  usuario_id integer references usuarios(id),
+  task_id    integer references tasks(id) on delete cascade,
+  titulo     text not null,
+  mensaje    text not null,
+  vence_en   real not null,  -- time.time() en que se debe avisar
+  enviado_en real            -- NULL mientras está pendiente
+);
+
+create index if not exists idx_reminders_pendientes on reminders(vence_en) where enviado_en is null;
+
+create table if not exists ajustes (
+  clave text primary key,
+  valor text not null    -- JSON; "hasher" = {"algoritmo": ..., "params": {...}}
+);
+
+pragma user_version = 9;
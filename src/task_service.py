@@ -1,38 +1,295 @@
+from datetime import date, datetime, timedelta
+from itertools import count
+
+from cache import TTLCache
 from db import get_conn
+from date_parser import fecha_iso
+
+# Lecturas por usuario en memoria. Cada escritura cambia la versión del usuario,
+# que forma parte de la clave: así una lectura que corría en paralelo con la
+# escritura nunca deja datos viejos visibles.
+_cache = TTLCache(maxsize=256, ttl=300)
+_versiones: dict[int, int] = {}
+_contador = count(1)
+
+# Las tareas se guardan con el id del usuario; `usuario` (el correo) se copia de
+# la tabla usuarios en el mismo INSERT. Si el id no existe no se inserta nada.
+_INSERTAR = (
+    "INSERT INTO tasks(usuario_id, usuario, texto, fecha, done, due_date) "
+    "SELECT id, correo, ?, ?, ?, ? FROM usuarios WHERE id=?"
+)
+
+# Consultas de lectura. Están aquí y no armadas dentro de cada función para que
+# tools/check_query_plan.py revise con EXPLAIN QUERY PLAN las mismas sentencias
+# que se ejecutan.
+_COLUMNAS = "id, texto, fecha, done, due_date"
+SQL_LISTAR = f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? ORDER BY id DESC"
+SQL_CONTAR_SECCIONES = (
+    "SELECT COALESCE(SUM(due_date < ?), 0), COALESCE(SUM(due_date = ?), 0), "
+    "COALESCE(SUM(due_date > ? OR due_date IS NULL), 0) FROM tasks WHERE usuario_id=?"
+)
+SQL_POR_VENCER = (
+    "SELECT id, usuario_id, texto, fecha, due_date FROM tasks "
+    "WHERE done = 0 AND due_date BETWEEN ? AND ? "
+    "ORDER BY due_date, usuario_id, id LIMIT ?"
+)
+# (parte, con cursor) -> SQL de una página del tablero. "future" se completa
+# con "sin_fecha". Sin cursor: (usuario_id, [hoy,] limite); con cursor se
+# agregan (due_date, id) o solo id antes del límite.
+SQL_SECCION = {
+    ("past", False): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date < ? "
+                     "ORDER BY due_date DESC, id DESC LIMIT ?",
+    ("past", True): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date < ? "
+                    "AND (due_date, id) < (?, ?) ORDER BY due_date DESC, id DESC LIMIT ?",
+    ("current", False): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date = ? "
+                        "ORDER BY id LIMIT ?",
+    ("current", True): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date = ? "
+                       "AND id > ? ORDER BY id LIMIT ?",
+    ("future", False): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date > ? "
+                       "ORDER BY due_date, id LIMIT ?",
+    ("future", True): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date > ? "
+                      "AND (due_date, id) > (?, ?) ORDER BY due_date, id LIMIT ?",
+    ("sin_fecha", False): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date IS NULL "
+                          "ORDER BY id LIMIT ?",
+    ("sin_fecha", True): f"SELECT {_COLUMNAS} FROM tasks WHERE usuario_id=? AND due_date IS NULL "
+                         "AND id > ? ORDER BY id LIMIT ?",
+}
+
+
+def _leer_cacheado(usuario_id: int, clave: tuple, cargar):
+    return _cache.get_or_load((usuario_id, _versiones.get(usuario_id, 0), *clave), lambda: tuple(cargar()))
+
+
+def _invalidar(usuario_id: int):
+    _versiones[usuario_id] = next(_contador)
+    _cache.discard_where(lambda clave: clave[0] == usuario_id)
+
+
+def cache_stats() -> dict[str, int]:
+    """Aciertos, fallos y tamaño de la caché de lecturas."""
+    return _cache.stats()
+
+
+def limpiar_cache():
+    _cache.clear()
+
+
+def _anio_de(creada) -> int | None:
+    """Año con el que se completan las fechas DD/MM de una tarea ya creada: el
+    de `created_at`, igual que en la migración v3. Así editar solo el título
+    no mueve el vencimiento de una tarea vieja."""
+    return datetime.fromtimestamp(creada).year if creada else None
+
 
-def agregar_tarea(correo: str, texto: str, fecha_ddmm: str, done: bool = False) -> bool:
-    correo, texto, fecha_ddmm = correo.strip().lower(), texto.strip(), fecha_ddmm.strip()
-    if not correo or not texto or not fecha_ddmm:
+def agregar_tarea(usuario_id: int, texto: str, fecha_ddmm: str, done: bool = False) -> bool:
+    texto, fecha_ddmm = texto.strip(), fecha_ddmm.strip()
+    if not usuario_id or not texto or not fecha_ddmm:
         return False
     try:
         with get_conn() as con:
-            con.execute(
-                "INSERT INTO tasks(usuario, texto, fecha, done) VALUES(?,?,?,?)",
-                (correo, texto, fecha_ddmm, int(bool(done))),
+            cursor = con.execute(
+                _INSERTAR, (texto, fecha_ddmm, int(bool(done)), fecha_iso(fecha_ddmm), usuario_id)
             )
-        return True
+        if cursor.rowcount > 0:
+            _invalidar(usuario_id)
+        return cursor.rowcount > 0
     except Exception:
         return False
 
-def actualizar_tarea(correo: str, tarea_id: int, texto: str, fecha_ddmm: str, done: bool) -> bool:
-    correo, texto = correo.strip().lower(), texto.strip()
+def actualizar_tarea(usuario_id: int, tarea_id: int, texto: str, fecha_ddmm: str, done: bool) -> bool:
+    texto = texto.strip()
     fecha_ddmm = fecha_ddmm.strip()
-    if not correo or not tarea_id or not texto:
+    if not usuario_id or not tarea_id or not texto:
         return False
     try:
         with get_conn() as con:
+            fila = con.execute(
+                "SELECT created_at FROM tasks WHERE id=? AND usuario_id=?", (tarea_id, usuario_id)
+            ).fetchone()
+            if fila is None:
+                return False
             cursor = con.execute(
-                "UPDATE tasks SET texto=?, fecha=?, done=? WHERE id=? AND usuario=?",
-                (texto, fecha_ddmm, int(bool(done)), tarea_id, correo),
+                "UPDATE tasks SET texto=?, fecha=?, done=?, due_date=? WHERE id=? AND usuario_id=?",
+                (texto, fecha_ddmm, int(bool(done)), fecha_iso(fecha_ddmm, _anio_de(fila[0])), tarea_id, usuario_id),
             )
+        if cursor.rowcount > 0:
+            _invalidar(usuario_id)
         return cursor.rowcount > 0
     except Exception:
         return False
 
-def listar_tareas(correo: str):
-    correo = correo.strip().lower()
-    with get_conn() as con:
-        return con.execute(
-            "SELECT id, texto, fecha, done FROM tasks WHERE usuario=? ORDER BY id DESC",
-            (correo,)
-        ).fetchall()
+def listar_tareas(usuario_id: int):
+
+    def cargar():
+        with get_conn() as con:
+            return con.execute(SQL_LISTAR, (usuario_id,)).fetchall()
+
+    return list(_leer_cacheado(usuario_id, ("todas",), cargar))
+
+def _ids_del_usuario(con, usuario_id: int, ids: list[int]) -> dict[int, float]:
+    """De `ids`, los que son del usuario, con su `created_at`."""
+    propios: dict[int, float] = {}
+    for inicio in range(0, len(ids), 500):
+        lote = ids[inicio:inicio + 500]
+        marcas = ",".join("?" * len(lote))
+        propios.update(
+            (row[0], row[1]) for row in con.execute(
+                f"SELECT id, created_at FROM tasks WHERE usuario_id=? AND id IN ({marcas})", (usuario_id, *lote)
+            )
+        )
+    return propios
+
+
+def agregar_tareas(usuario_id: int, tareas) -> list[bool]:
+    """Inserta varias tareas en una sola transacción.
+
+    Cada tarea es un dict con `texto`, `fecha` y opcionalmente `done`.
+    Devuelve un bool por tarea, en el mismo orden (False si faltaban datos o
+    el usuario no existe).
+    """
+    resultados: list[bool] = []
+    filas = []
+    for tarea in tareas:
+        texto = str(tarea.get("texto") or "").strip()
+        fecha = str(tarea.get("fecha") or "").strip()
+        valida = bool(usuario_id and texto and fecha)
+        resultados.append(valida)
+        if valida:
+            filas.append((texto, fecha, int(bool(tarea.get("done"))), fecha_iso(fecha), usuario_id))
+    if not filas:
+        return resultados
+    try:
+        with get_conn() as con:
+            if not con.execute("SELECT 1 FROM usuarios WHERE id=?", (usuario_id,)).fetchone():
+                return [False] * len(resultados)
+            con.executemany(_INSERTAR, filas)
+    except Exception:
+        return [False] * len(resultados)
+    _invalidar(usuario_id)
+    return resultados
+
+
+def actualizar_tareas(usuario_id: int, cambios) -> list[bool]:
+    """Actualiza varias tareas del usuario en una sola transacción.
+
+    Cada cambio es un dict con `id`, `texto`, `fecha` y `done`. Devuelve un
+    bool por cambio: False si faltaban datos o la tarea no es del usuario.
+    """
+    cambios = list(cambios)
+    if not usuario_id:
+        return [False] * len(cambios)
+    try:
+        with get_conn() as con:
+            propios = _ids_del_usuario(con, usuario_id, [c.get("id") for c in cambios if c.get("id")])
+            resultados: list[bool] = []
+            filas = []
+            for cambio in cambios:
+                texto = str(cambio.get("texto") or "").strip()
+                fecha = str(cambio.get("fecha") or "").strip()
+                valido = bool(texto) and cambio.get("id") in propios
+                resultados.append(valido)
+                if valido:
+                    filas.append((
+                        texto, fecha, int(bool(cambio.get("done"))),
+                        fecha_iso(fecha, _anio_de(propios[cambio["id"]])), cambio["id"], usuario_id,
+                    ))
+            con.executemany(
+                "UPDATE tasks SET texto=?, fecha=?, done=?, due_date=? WHERE id=? AND usuario_id=?",
+                filas,
+            )
+        if filas:
+            _invalidar(usuario_id)
+        return resultados
+    except Exception:
+        return [False] * len(cambios)
+
+
+def marcar_hechas(usuario_id: int, ids, done: bool = True) -> list[bool]:
+    """Marca (o desmarca) varias tareas como hechas en una sola transacción."""
+    ids = list(ids)
+    if not usuario_id:
+        return [False] * len(ids)
+    try:
+        with get_conn() as con:
+            propios = _ids_del_usuario(con, usuario_id, ids)
+            con.executemany(
+                "UPDATE tasks SET done=? WHERE id=? AND usuario_id=?",
+                [(int(bool(done)), tarea_id, usuario_id) for tarea_id in ids if tarea_id in propios],
+            )
+        if propios:
+            _invalidar(usuario_id)
+        return [tarea_id in propios for tarea_id in ids]
+    except Exception:
+        return [False] * len(ids)
+
+
+SECCIONES = ("past", "current", "future")
+
+
+def listar_tareas_seccion(usuario_id: int, seccion: str, hoy: date | None = None,
+                          limite: int | None = None, despues_de: tuple | None = None):
+    """Tareas de una sección del tablero respecto de `hoy`.
+
+    past:    due_date < hoy, de la más reciente a la más vieja.
+    current: due_date = hoy, por id.
+    future:  due_date > hoy por fecha y al final las que no tienen fecha.
+
+    Para paginar se pasa `despues_de=(due_date, id)` de la última fila recibida.
+    """
+    if seccion not in SECCIONES:
+        raise ValueError(f"Sección desconocida: {seccion}")
+    hoy_iso = (hoy or date.today()).isoformat()
+    despues_de = tuple(despues_de) if despues_de else None
+    return list(_leer_cacheado(
+        usuario_id,
+        ("seccion", seccion, hoy_iso, limite, despues_de),
+        lambda: _consultar_seccion(usuario_id, seccion, hoy_iso, limite, despues_de),
+    ))
+
+
+def _consultar_seccion(usuario_id: int, seccion: str, hoy_iso: str, limite: int | None, despues_de: tuple | None):
+    tope = -1 if limite is None else int(limite)
+    con = get_conn()
+
+    if seccion == "past":
+        cursor = tuple(despues_de) if despues_de else ()
+        return con.execute(SQL_SECCION["past", bool(despues_de)], (usuario_id, hoy_iso, *cursor, tope)).fetchall()
+
+    if seccion == "current":
+        cursor = (despues_de[1],) if despues_de else ()
+        return con.execute(SQL_SECCION["current", bool(despues_de)], (usuario_id, hoy_iso, *cursor, tope)).fetchall()
+
+    filas = []
+    if not despues_de or despues_de[0] is not None:
+        cursor = tuple(despues_de) if despues_de else ()
+        filas = con.execute(SQL_SECCION["future", bool(despues_de)], (usuario_id, hoy_iso, *cursor, tope)).fetchall()
+        if limite is not None and len(filas) >= limite:
+            return filas
+        despues_de = None
+    cursor = (despues_de[1],) if despues_de else ()
+    restantes = -1 if limite is None else limite - len(filas)
+    return filas + con.execute(SQL_SECCION["sin_fecha", bool(despues_de)], (usuario_id, *cursor, restantes)).fetchall()
+
+
+def contar_tareas_por_seccion(usuario_id: int, hoy: date | None = None) -> dict[str, int]:
+    """Cantidad de tareas por sección, en una pasada sobre el índice del usuario."""
+    hoy_iso = (hoy or date.today()).isoformat()
+
+    def cargar():
+        return get_conn().execute(SQL_CONTAR_SECCIONES, (hoy_iso, hoy_iso, hoy_iso, usuario_id)).fetchone()
+
+    return dict(zip(SECCIONES, _leer_cacheado(usuario_id, ("conteo", hoy_iso), cargar)))
+
+
+def tareas_por_vencer(dias: int = 1, hoy: date | None = None, limite: int | None = None):
+    """Tareas pendientes de todos los usuarios que vencen entre `hoy` y
+    `hoy + dias` (inclusive), por fecha, usuario e id.
+
+    Es un rango sobre idx_tasks_por_vencer; no pasa por la caché porque no es
+    de un solo usuario.
+    """
+    desde = hoy or date.today()
+    hasta = desde + timedelta(days=max(0, int(dias)))
+    return get_conn().execute(
+        SQL_POR_VENCER, (desde.isoformat(), hasta.isoformat(), -1 if limite is None else int(limite))
+    ).fetchall()
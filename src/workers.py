@@ -0,0 +1,86 @@
+"""Ejecuta llamadas a los servicios fuera del hilo de Tk.
+
+Tk solo se puede tocar desde su hilo, así que los resultados vuelven por una
+cola que se revisa con `after()`. La cola solo se revisa mientras hay trabajos
+pendientes. Cada trabajo pertenece a un ámbito (por ejemplo "screen"):
+`cancel(ambito)` descarta los resultados que aún no llegaron, útil cuando el
+usuario ya cambió de pantalla.
+"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+
+
+class TkExecutor:
+    def __init__(self, widget, max_workers: int = 2, poll_ms: int = 20):
+        self._widget = widget
+        self._poll_ms = poll_ms
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="abhub-db")
+        self._resultados: queue.SimpleQueue = queue.SimpleQueue()
+        self._generaciones: dict[str, int] = {}
+        self._pendientes = 0
+        self._lock = threading.Lock()
+        self._revisando = False
+        self._cerrado = False
+
+    def submit(self, ambito: str, fn, *args, on_done=None, on_error=None, **kwargs) -> Future:
+        """Corre `fn(*args, **kwargs)` en un hilo de trabajo.
+
+        `on_done(resultado)` u `on_error(excepcion)` se llaman luego en el hilo
+        de Tk, salvo que el ámbito se haya cancelado mientras tanto.
+        """
+        generacion = self._generaciones.get(ambito, 0)
+        with self._lock:
+            self._pendientes += 1
+        future = self._pool.submit(fn, *args, **kwargs)
+        future.add_done_callback(
+            lambda f: self._resultados.put((ambito, generacion, f, on_done, on_error))
+        )
+        self._programar_revision()
+        return future
+
+    def cancel(self, ambito: str):
+        """Descarta los resultados pendientes del ámbito."""
+        self._generaciones[ambito] = self._generaciones.get(ambito, 0) + 1
+
+    def pending(self) -> int:
+        with self._lock:
+            return self._pendientes
+
+    def shutdown(self):
+        self._cerrado = True
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _programar_revision(self):
+        if self._revisando or self._cerrado:
+            return
+        self._revisando = True
+        self._widget.after(self._poll_ms, self._revisar)
+
+    def _revisar(self):
+        self._revisando = False
+        try:
+            while True:
+                try:
+                    ambito, generacion, future, on_done, on_error = self._resultados.get_nowait()
+                except queue.Empty:
+                    break
+                with self._lock:
+                    self._pendientes -= 1
+                if self._cerrado or future.cancelled() or generacion != self._generaciones.get(ambito, 0):
+                    continue
+                # Un callback que falla no debe dejar sin entregar a los demás.
+                try:
+                    error = future.exception()
+                    if error is not None:
+                        if on_error:
+                            on_error(error)
+                        else:
+                            print("Error en segundo plano:", error)
+                    elif on_done:
+                        on_done(future.result())
+                except Exception as exc:
+                    print("Error en callback de segundo plano:", exc)
+        finally:
+            if self.pending():
+                self._programar_revision()
@@ -0,0 +1,79 @@
+"""Compara las operaciones por lote de `task_service` contra el camino fila por fila.
+
+Para cada tamaño mide insertar N tareas y marcarlas como hechas, primero con
+agregar_tarea/actualizar_tarea (una transacción por fila) y luego con
+agregar_tareas/marcar_hechas (una sola transacción).
+
+    python tools/bench_batch.py --sizes 1000 10000 100000
+"""
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import db  # noqa: E402
+import task_service  # noqa: E402
+
+
+def crear_usuario(correo: str) -> int:
+    with db.get_conn() as con:
+        return con.execute(
+            "INSERT INTO usuarios(correo, contrasena, nombre) VALUES(?, '-', 'Bench')", (correo,)
+        ).lastrowid
+
+
+def _cronometrar(fn) -> float:
+    inicio = time.perf_counter()
+    fn()
+    return time.perf_counter() - inicio
+
+
+def medir(n: int, tmpdir: pathlib.Path) -> dict[str, float]:
+    tareas = [{"texto": f"Tarea {i}", "fecha": f"{i % 28 + 1:02d}/05/2026"} for i in range(n)]
+    tiempos = {}
+
+    db.DB_PATH = tmpdir / f"fila-{n}.db"
+    usuario = crear_usuario("fila@ucol.mx")
+
+    def por_fila_insert():
+        for tarea in tareas:
+            task_service.agregar_tarea(usuario, tarea["texto"], tarea["fecha"])
+
+    tiempos["insert fila"] = _cronometrar(por_fila_insert)
+    filas = task_service.listar_tareas(usuario)
+
+    def por_fila_done():
+        for row in filas:
+            task_service.actualizar_tarea(usuario, row["id"], row["texto"], row["fecha"], True)
+
+    tiempos["done fila"] = _cronometrar(por_fila_done)
+    db.close_all()
+
+    db.DB_PATH = tmpdir / f"lote-{n}.db"
+    usuario = crear_usuario("lote@ucol.mx")
+    tiempos["insert lote"] = _cronometrar(lambda: task_service.agregar_tareas(usuario, tareas))
+    ids = [row["id"] for row in task_service.listar_tareas(usuario)]
+    tiempos["done lote"] = _cronometrar(lambda: task_service.marcar_hechas(usuario, ids))
+    db.close_all()
+    return tiempos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args(argv)
+
+    columnas = ("insert fila", "insert lote", "done fila", "done lote")
+    print(f"{'filas':>8}" + "".join(f"{c + ' /s':>16}" for c in columnas))
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in args.sizes:
+            tiempos = medir(n, pathlib.Path(tmp))
+            print(f"{n:>8}" + "".join(f"{n / tiempos[c]:>16.0f}" for c in columnas))
+
+
+if __name__ == "__main__":
+    main()
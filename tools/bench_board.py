@@ -0,0 +1,78 @@
+"""Tiempo de dibujo de tarjetas del tablero: figuras del canvas vs sprites.
+
+Dibuja N tarjetas con _draw_task_card en un canvas real (hace falta pantalla)
+y fuerza el render con update_idletasks(). Compara el camino con polígonos
+suavizados (sin Pillow) contra los sprites pre-renderizados.
+
+    python tools/bench_board.py --cards 500
+"""
+import argparse
+import pathlib
+import sys
+import time
+import tkinter as tk
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import login_screen  # noqa: E402
+from login_screen import LoginScreen  # noqa: E402
+
+
+def crear_pantalla() -> LoginScreen:
+    """LoginScreen sin la ventana maximizada ni la pantalla de login."""
+    app = LoginScreen.__new__(LoginScreen)
+    tk.Tk.__init__(app)
+    app.withdraw()
+    app.scale = 1.0
+    app.offset_x = app.offset_y = 0
+    app.window_width, app.window_height = login_screen.DESIGN_WIDTH, login_screen.DESIGN_HEIGHT
+    app.canvas = tk.Canvas(app, width=app.window_width, height=app.window_height)
+    app.canvas.pack()
+    app.fonts = app._prepare_fonts()
+    app.sprite_cache = {}
+    app.use_card_sprites = True
+    app.executor = login_screen.TkExecutor(app)
+    app.login_busy = app.register_busy = False
+    return app
+
+
+def dibujar(app: LoginScreen, cards: int, sprites: bool) -> float:
+    app.canvas.delete("all")
+    app.update_idletasks()
+    app.use_card_sprites = sprites
+    inicio = time.perf_counter()
+    for index in range(cards):
+        x, y = app._card_slot(0, index)
+        task = {"title": f"Tarea {index}", "date": "01/05/2026", "status": "done" if index % 2 else "pending"}
+        app._draw_task_card(x, y, task)
+    app.update_idletasks()
+    return time.perf_counter() - inicio
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    try:
+        app = crear_pantalla()
+    except tk.TclError as exc:
+        print(f"Se necesita una pantalla para medir el canvas: {exc}")
+        return
+    if login_screen.Image is None:
+        print("Pillow no está instalado: solo se mide el camino con figuras.")
+
+    for sprites in (False, True):
+        if sprites and login_screen.Image is None:
+            break
+        mejor = min(dibujar(app, args.cards, sprites) for _ in range(args.repeat))
+        items = len(app.canvas.find_all())
+        nombre = "sprites" if sprites else "figuras"
+        print(f"{nombre:<8} {args.cards} tarjetas: {mejor * 1000:8.1f} ms, {items} items en el canvas")
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Estado de vencimiento de N tareas: fila por fila vs estados_por_lote.
+
+Compara el cálculo anterior (una llamada a datetime.now() por tarea) con el
+lote contra un único "hoy", con NumPy y con el camino en Python puro. No
+necesita base de datos ni pantalla.
+
+    python tools/bench_estados.py --n 100000
+"""
+import argparse
+import pathlib
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import fechas  # noqa: E402
+
+
+def estado_fila(fecha_texto: str) -> str:
+    try:
+        dd, mm, aaaa = fecha_texto.replace('-', '/').split('/')
+        dt = datetime(int(aaaa), int(mm), int(dd))
+    except Exception:
+        d = 0
+    else:
+        d = (dt - datetime.now()).days
+    if d < 0:
+        return 'VENCIDO'
+    if d == 0:
+        return 'HOY'
+    if d <= 3:
+        return 'PRONTO'
+    return 'A TIEMPO'
+
+
+def medir(nombre: str, fn) -> None:
+    inicio = time.perf_counter()
+    fn()
+    print(f"{nombre:<16} {(time.perf_counter() - inicio) * 1000:8.1f} ms")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100_000)
+    args = parser.parse_args(argv)
+
+    rnd = random.Random(3)
+    hoy = date.today()
+    textos = [(hoy + timedelta(days=rnd.randrange(-400, 400))).strftime("%d/%m/%Y") for _ in range(args.n)]
+
+    print(f"{args.n} tareas")
+    medir("fila por fila", lambda: [estado_fila(t) for t in textos])
+    medir("lote python", lambda: fechas.estados_por_lote(textos, hoy, usar_numpy=False))
+    if fechas.np is not None:
+        medir("lote numpy", lambda: fechas.estados_por_lote(textos, hoy))
+    else:
+        print("NumPy no está instalado: solo se mide el camino en Python.")
+
+
+if __name__ == "__main__":
+    main()
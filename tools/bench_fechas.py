@@ -0,0 +1,91 @@
+"""Lectura de 100k fechas en formatos mezclados: strptime vs date_parser.
+
+Compara la cadena de `strptime` que usaba la app (hasta 2 candidatos x 4
+formatos, una excepción por intento fallido) con el parser de date_parser,
+sin caché y con la caché por texto. No necesita base de datos ni pantalla.
+
+    python tools/bench_fechas.py --n 100000 --distintas 2000
+"""
+import argparse
+import pathlib
+import random
+import sys
+import time
+from datetime import date, datetime
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import date_parser  # noqa: E402
+
+FORMATOS = ("%d/%m/%Y", "%Y-%m-%d", "%d-%m-%Y", "%d/%m/%y")
+
+
+def parse_strptime(texto, anio=None):
+    if not texto:
+        return None
+    texto = str(texto).strip()
+    if not texto:
+        return None
+    candidatos = [texto]
+    if len(texto) == 5 and "/" in texto:
+        candidatos.append(f"{texto}/{anio or date.today().year}")
+    for candidato in candidatos:
+        for formato in FORMATOS:
+            try:
+                return datetime.strptime(candidato, formato).date()
+            except ValueError:
+                continue
+    return None
+
+
+def generar(n: int, distintas: int, semilla: int = 7) -> list[str]:
+    rnd = random.Random(semilla)
+    formas = (
+        lambda d: d.strftime("%d/%m/%Y"),
+        lambda d: d.isoformat(),
+        lambda d: d.strftime("%d-%m-%Y"),
+        lambda d: d.strftime("%d/%m/%y"),
+        lambda d: d.strftime("%d/%m"),
+        lambda d: "sin fecha",
+    )
+    base = date(2024, 1, 1).toordinal()
+    textos = [
+        rnd.choice(formas)(date.fromordinal(base + rnd.randrange(1500)))
+        for _ in range(distintas)
+    ]
+    return [rnd.choice(textos) for _ in range(n)]
+
+
+def medir(nombre: str, fn, textos: list[str]) -> float:
+    inicio = time.perf_counter()
+    for texto in textos:
+        fn(texto)
+    segundos = time.perf_counter() - inicio
+    print(f"{nombre:<14} {len(textos)} fechas: {segundos * 1000:8.1f} ms ({segundos / len(textos) * 1e9:6.0f} ns c/u)")
+    return segundos
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=100_000)
+    parser.add_argument("--distintas", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    textos = generar(args.n, args.distintas)
+    distintas = set(textos)
+    diferentes = [t for t in distintas if parse_strptime(t) != date_parser.parse_fecha(t)]
+    if diferentes:
+        print("Resultados distintos a strptime:", diferentes[:5])
+
+    medir("strptime", parse_strptime, textos)
+    sin_cache = date_parser._parsear.__wrapped__
+    anio = date.today().year
+    medir("manual", lambda t: sin_cache(t, anio if t.count("/") == 1 else None), textos)
+    date_parser._parsear.cache_clear()
+    medir("manual+cache", date_parser.parse_fecha, textos)
+    print(date_parser.cache_info())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Logins concurrentes con auth_service.login_async.
+
+Crea usuarios de prueba en una base temporal, lanza N intentos a la vez
+(algunos con contraseña incorrecta) y muestra la latencia por intento y el
+rendimiento total del pool de procesos. Los intentos que pasan de
+MAX_LOGINS_PENDIENTES se rechazan al instante y cuentan como "rejected".
+
+    python tools/bench_login.py --usuarios 20 --intentos 64
+"""
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import auth_service  # noqa: E402
+import db  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--usuarios", type=int, default=20)
+    parser.add_argument("--intentos", type=int, default=64)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        db.DB_PATH = pathlib.Path(carpeta) / "bench.db"
+        correos = [f"usuario{i}@bench.test" for i in range(args.usuarios)]
+        for correo in correos:
+            auth_service.registrar_usuario(correo, "Clave2025", "Bench")
+
+        inicio = time.perf_counter()
+        futuros = [
+            auth_service.login_async(correos[i % len(correos)], "Clave2025" if i % 4 else "incorrecta")
+            for i in range(args.intentos)
+        ]
+        resultados = [f.result() for f in futuros]
+        segundos = time.perf_counter() - inicio
+
+        aceptados = sum(ok for ok, _, _ in resultados)
+        print(f"{args.intentos} intentos en {segundos:.2f} s ({args.intentos / segundos:.1f}/s), {aceptados} correctos")
+        print(auth_service.login_stats())
+        auth_service.cerrar_pool_logins()
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Llamadas por segundo a mensajes_adapter.t().
+
+Compara el catálogo compilado contra la versión anterior (dos try/except y
+str.format en cada llamada) con una clave sin campos, una con campos y una que
+no existe.
+
+    python tools/bench_mensajes.py --n 500000
+"""
+import argparse
+import pathlib
+import sys
+import timeit
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import mensajes_adapter  # noqa: E402
+
+PRUEBA = {"saludo": "Hola {nombre}, tienes {n} tareas"}
+
+
+def t_anterior(clave: str, **kv) -> str:
+    catalogo = mensajes_adapter._TEXTOS
+
+    def externo(clave: str, **kv) -> str:
+        base = catalogo.get(clave, clave)
+        try:
+            return base.format(**kv) if kv else base
+        except Exception:
+            return base
+
+    try:
+        return externo(clave, **kv)
+    except Exception:
+        base = catalogo.get(clave, clave)
+        try:
+            return base.format(**kv) if kv else base
+        except Exception:
+            return base
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=500_000)
+    args = parser.parse_args(argv)
+
+    base = mensajes_adapter.LOCALE_BASE
+    textos, formatos, claves = mensajes_adapter._catalogo(base)
+    mensajes_adapter._compilados[base] = mensajes_adapter._compilar({**textos, **PRUEBA})
+    mensajes_adapter.usar_locale(base)
+    casos = {
+        "sin campos": ("auth_ok", {}),
+        "con campos": ("saludo", {"nombre": "Ana", "n": 3}),
+        "no existe": ("no_existe", {}),
+    }
+    print(f"{'caso':<12}{'anterior /s':>14}{'compilado /s':>14}")
+    for nombre, (clave, kv) in casos.items():
+        fila = []
+        for fn in (t_anterior, mensajes_adapter.t):
+            segundos = min(timeit.repeat(lambda: fn(clave, **kv), number=args.n, repeat=3))
+            fila.append(args.n / segundos)
+        assert t_anterior(clave, **kv) == mensajes_adapter.t(clave, **kv)
+        print(f"{nombre:<12}{fila[0]:>14,.0f}{fila[1]:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Avisos uno por uno contra la cola que los junta.
+
+Simula un backend lento (como el toast de Windows, que bloquea mientras se
+muestra) y manda N avisos en ráfagas. Muestra cuánto queda bloqueado quien
+avisa, cuántas notificaciones ve el usuario y la latencia de entrega.
+
+    python tools/bench_notify.py --n 200 --backend-ms 50 --ventana 0.5
+"""
+import argparse
+import pathlib
+import sys
+import time
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+from notify_task import NotificationQueue  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=200)
+    parser.add_argument("--rafaga", type=int, default=20, help="avisos por ráfaga")
+    parser.add_argument("--backend-ms", type=float, default=50.0)
+    parser.add_argument("--ventana", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    def backend_lento(titulo, mensaje):
+        time.sleep(args.backend_ms / 1000)
+        return True
+
+    def enviar(notifier):
+        inicio = time.perf_counter()
+        bloqueado = 0.0
+        for i in range(args.n):
+            t0 = time.perf_counter()
+            notifier("Recordatorio", f"Tarea {i}")
+            bloqueado += time.perf_counter() - t0
+            if (i + 1) % args.rafaga == 0:
+                time.sleep(args.ventana * 2)
+        return bloqueado, time.perf_counter() - inicio
+
+    bloqueado, _ = enviar(backend_lento)
+    print(f"directo: {args.n} notificaciones, {bloqueado * 1000:.0f} ms bloqueado")
+
+    cola = NotificationQueue(backend_lento, ventana=args.ventana, max_cola=args.n)
+    bloqueado, _ = enviar(cola)
+    cola.close()
+    datos = cola.stats()["backend_lento"]
+    print(
+        f"cola:    {datos['notifications']} notificaciones para {datos['items']} avisos, "
+        f"{bloqueado * 1000:.1f} ms bloqueado, latencia media {datos['avg_latency_ms']:.0f} ms "
+        f"(máx {datos['max_latency_ms']:.0f}), {datos['overflowed']} sumados al resumen por cola llena"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Microbenchmark de las mezclas de color de un redibujado completo.
+
+Reproduce las llamadas a _apply_opacity/_blend_colors que hacen el dashboard,
+la barra de navegación, la sombra del panel y un tablero de N tarjetas, y
+compara la mezcla original (parsea los hex en cada llamada) con la memoizada.
+No necesita pantalla.
+
+    python tools/bench_palette.py --cards 500
+"""
+import argparse
+import pathlib
+import sys
+import timeit
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR))
+
+import login_screen  # noqa: E402
+from login_screen import BACKGROUND_COLOR, SECONDARY_COLOR, WHITE  # noqa: E402
+
+
+def mezcla_original(foreground, background, alpha):
+    def hex_to_rgb(value):
+        value = value.lstrip("#")
+        return tuple(int(value[i:i + 2], 16) for i in (0, 2, 4))
+
+    fg_r, fg_g, fg_b = hex_to_rgb(foreground)
+    bg_r, bg_g, bg_b = hex_to_rgb(background)
+    r = round(fg_r * alpha + bg_r * (1 - alpha))
+    g = round(fg_g * alpha + bg_g * (1 - alpha))
+    b = round(fg_b * alpha + bg_b * (1 - alpha))
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+def llamadas_redibujado(cards: int) -> list[tuple[str, str, float]]:
+    dashboard = [
+        ("#F4F7F6", 0.10), (WHITE, 0.15), (BACKGROUND_COLOR, 0.50), (BACKGROUND_COLOR, 0.50),
+        (BACKGROUND_COLOR, 0.50), (BACKGROUND_COLOR, 0.50), (WHITE, 0.50), (WHITE, 0.50),
+        (WHITE, 0.50), (WHITE, 0.50),
+    ]
+    nav = [(BACKGROUND_COLOR, 0.5), (SECONDARY_COLOR, 0.4)] * 4 + [(WHITE, 0.65), (SECONDARY_COLOR, 1.0)]
+    tarjetas = [(WHITE, 0.85)] * cards
+    llamadas = [(color, BACKGROUND_COLOR, alpha) for color, alpha in dashboard + nav + tarjetas]
+    sombra = [("#000000", BACKGROUND_COLOR, 0.25 * (1 - i / 90)) for i in range(90)]
+    return llamadas + sombra
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--number", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    llamadas = llamadas_redibujado(args.cards)
+    sombra = [alpha for _, _, alpha in llamadas[-90:]]
+
+    def original():
+        for foreground, background, alpha in llamadas:
+            mezcla_original(foreground, background, alpha)
+
+    def memoizada():
+        for foreground, background, alpha in llamadas[:-90]:
+            login_screen.blend_colors(foreground, background, alpha)
+        login_screen.blend_gradient("#000000", BACKGROUND_COLOR, sombra)
+
+    for nombre, fn in (("original", original), ("memoizada", memoizada)):
+        segundos = min(timeit.repeat(fn, number=args.number, repeat=5)) / args.number
+        print(f"{nombre:<10} {len(llamadas)} mezclas por redibujado: {segundos * 1e6:9.1f} us")
+    print(login_screen.blend_colors.cache_info())
+
+
+if __name__ == "__main__":
+    main()
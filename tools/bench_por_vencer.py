@@ -0,0 +1,101 @@
+"""Tareas por vencer de todos los usuarios: recorrido en Python contra el índice.
+
+Arma una base temporal con N tareas (1M por defecto) repartidas entre varios
+usuarios y fechas de dos años, y compara dos formas de encontrar las
+pendientes que vencen en los próximos días:
+
+  python: leer todas las pendientes y calcular dias_faltantes() de cada `fecha`
+  indice: task_service.tareas_por_vencer(), un rango sobre idx_tasks_por_vencer
+
+También mide cuánto cuesta mantener el índice al insertar.
+
+    python tools/bench_por_vencer.py --n 1000000 --usuarios 1000 --dias 7
+"""
+import argparse
+import pathlib
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+sys.path.insert(0, str(ROOT_DIR))
+
+import db  # noqa: E402
+import task_service  # noqa: E402
+from fechas import dias_faltantes  # noqa: E402
+
+
+def llenar(n: int, usuarios: int, hoy: date, lote: int = 50_000) -> float:
+    """Inserta n tareas directo con executemany y devuelve los segundos."""
+    azar = random.Random(7)
+    con = db.get_conn()
+    with con:
+        con.executemany(
+            "INSERT INTO usuarios(id, correo, contrasena, nombre) VALUES(?, ?, '-', 'Bench')",
+            [(u, f"u{u}@ucol.mx") for u in range(1, usuarios + 1)],
+        )
+    inicio = time.perf_counter()
+    for desde in range(0, n, lote):
+        filas = []
+        for _ in range(min(lote, n - desde)):
+            vence = hoy + timedelta(days=azar.randint(-365, 365))
+            usuario = azar.randint(1, usuarios)
+            filas.append((usuario, f"u{usuario}@ucol.mx", "Tarea", vence.strftime("%d/%m/%Y"),
+                          int(azar.random() < 0.4), vence.isoformat()))
+        with con:
+            con.executemany(
+                "INSERT INTO tasks(usuario_id, usuario, texto, fecha, done, due_date) VALUES(?,?,?,?,?,?)",
+                filas,
+            )
+    return time.perf_counter() - inicio
+
+
+def por_vencer_python(hoy: date, dias: int) -> list[int]:
+    ids = []
+    for fila in db.get_conn().execute("SELECT id, fecha FROM tasks WHERE done = 0"):
+        if 0 <= dias_faltantes(fila["fecha"], hoy) <= dias:
+            ids.append(fila["id"])
+    return ids
+
+
+def _cronometrar(fn, repeticiones: int = 3):
+    mejor, resultado = float("inf"), None
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        resultado = fn()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor, resultado
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=1_000_000)
+    parser.add_argument("--usuarios", type=int, default=1000)
+    parser.add_argument("--dias", type=int, default=7)
+    args = parser.parse_args(argv)
+    hoy = date.today()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        db.DB_PATH = pathlib.Path(carpeta) / "sin_indice.db"
+        db.get_conn().execute("DROP INDEX idx_tasks_por_vencer")
+        sin_indice = llenar(args.n, args.usuarios, hoy)
+        db.close_all()
+
+        db.DB_PATH = pathlib.Path(carpeta) / "por_vencer.db"
+        con_indice = llenar(args.n, args.usuarios, hoy)
+        print(f"insertar {args.n} tareas: {sin_indice:.1f} s sin el índice, {con_indice:.1f} s con él")
+
+        t_python, ids_python = _cronometrar(lambda: por_vencer_python(hoy, args.dias), 1)
+        t_indice, filas = _cronometrar(lambda: task_service.tareas_por_vencer(args.dias, hoy))
+        assert sorted(ids_python) == sorted(fila["id"] for fila in filas)
+        print(f"{len(filas)} pendientes en los próximos {args.dias} días")
+        print(f"python: {t_python * 1000:9.1f} ms")
+        print(f"indice: {t_indice * 1000:9.1f} ms  ({t_python / t_indice:.0f}x)")
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main()
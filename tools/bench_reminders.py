@@ -0,0 +1,63 @@
+"""Costo del despachador de recordatorios con muchos pendientes.
+
+Programa N recordatorios en una base temporal, repartidos en los próximos
+segundos y en las próximas horas, deja correr el despachador y muestra el
+retraso al avisar y el CPU que gastó el proceso (casi nada mientras espera).
+
+    python tools/bench_reminders.py --n 5000 --segundos 10
+"""
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import db  # noqa: E402
+import scheduler  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--n", type=int, default=5000)
+    parser.add_argument("--segundos", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        db.DB_PATH = pathlib.Path(carpeta) / "reminders.db"
+        retrasos = []
+        vencimientos = {}
+
+        def notifier(titulo, mensaje):
+            retrasos.append(time.time() - vencimientos[mensaje])
+            return True
+
+        despachador = scheduler.ReminderScheduler(notifier)
+        despachador.start()
+        inicio = time.time()
+        cercanos = max(1, args.n // 100)
+        for i in range(args.n):
+            if i < cercanos:
+                cuando = inicio + 1 + (args.segundos - 2) * i / cercanos
+            else:
+                cuando = inicio + 3600 + i
+            vencimientos[f"r{i}"] = cuando
+            despachador.programar("Recordatorio", f"r{i}", cuando)
+
+        cpu_inicio = time.process_time()
+        time.sleep(args.segundos)
+        cpu = time.process_time() - cpu_inicio
+        despachador.stop()
+
+        print(f"{args.n} recordatorios, {len(retrasos)} vencidos en {args.segundos:.0f} s")
+        if retrasos:
+            print(f"retraso medio {sum(retrasos) / len(retrasos) * 1000:.2f} ms, máximo {max(retrasos) * 1000:.2f} ms")
+        print(f"CPU del proceso mientras esperaba: {cpu * 1000:.1f} ms")
+        print(despachador.stats())
+        db.close_all()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Tiempo de ida y vuelta login <-> registro (hace falta pantalla).
+
+Compara la sombra del panel dibujada como 90 rectángulos contra la imagen
+cacheada que usa la app.
+
+    python tools/bench_screens.py --toggles 50
+"""
+import argparse
+import time
+import tkinter as tk
+
+from bench_board import crear_pantalla
+
+
+def alternar(app, toggles: int, shadow_image: bool) -> float:
+    app.use_shadow_image = shadow_image
+    app.show_login_screen()
+    app.update_idletasks()
+    inicio = time.perf_counter()
+    for _ in range(toggles):
+        app.show_register_screen()
+        app.update_idletasks()
+        app.show_login_screen()
+        app.update_idletasks()
+    return (time.perf_counter() - inicio) / (2 * toggles)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--toggles", type=int, default=50)
+    args = parser.parse_args(argv)
+
+    try:
+        app = crear_pantalla()
+    except tk.TclError as exc:
+        print(f"Se necesita una pantalla para medir el canvas: {exc}")
+        return
+    app.overlay_widgets = []
+    app.active_images = []
+    app.image_cache = {}
+    app.shadow_colors = None
+    app.pending_email = None
+    app.task_modal_window = None
+    app.chevron_photo = app._load_chevron_image()
+
+    for shadow_image, nombre in ((False, "rectangulos"), (True, "imagen")):
+        promedio = alternar(app, args.toggles, shadow_image)
+        print(f"sombra {nombre:<12} {promedio * 1000:8.2f} ms por cambio de pantalla")
+    app.destroy()
+
+
+if __name__ == "__main__":
+    main()
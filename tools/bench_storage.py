@@ -0,0 +1,77 @@
+"""Microbenchmark de los perfiles de almacenamiento de `db`.
+
+Crea una base temporal por perfil y mide agregar_tarea/actualizar_tarea,
+un commit por fila, tal como lo hace la app al guardar desde el modal.
+
+    python tools/bench_storage.py --rows 2000
+"""
+import argparse
+import pathlib
+import sys
+import tempfile
+import time
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import db  # noqa: E402
+import task_service  # noqa: E402
+
+# Valores por defecto de SQLite, como referencia de lo que había antes.
+SQLITE_DEFAULTS = {
+    "name": "sqlite-defaults",
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "mmap_size": 0,
+    "temp_store": "DEFAULT",
+    "busy_timeout": 5000,
+}
+
+
+def crear_usuario(correo: str) -> int:
+    with db.get_conn() as con:
+        return con.execute(
+            "INSERT INTO usuarios(correo, contrasena, nombre) VALUES(?, '-', 'Bench')", (correo,)
+        ).lastrowid
+
+
+def medir(perfil, rows: int, tmpdir: pathlib.Path) -> tuple[float, float]:
+    nombre = perfil if isinstance(perfil, str) else perfil["name"]
+    db.DB_PATH = tmpdir / f"bench-{nombre}.db"
+    db.set_storage_profile(perfil)
+
+    usuario = crear_usuario("bench@ucol.mx")
+    inicio = time.perf_counter()
+    for i in range(rows):
+        task_service.agregar_tarea(usuario, f"Tarea {i}", "01/01/2030")
+    insertar = time.perf_counter() - inicio
+
+    ids = [row["id"] for row in task_service.listar_tareas(usuario)]
+    if len(ids) != rows:
+        raise SystemExit(f"Se esperaban {rows} tareas y hay {len(ids)}")
+    inicio = time.perf_counter()
+    for tarea_id in ids:
+        task_service.actualizar_tarea(usuario, tarea_id, "Editada", "02/01/2030", True)
+    actualizar = time.perf_counter() - inicio
+
+    db.close_all()
+    return rows / insertar, rows / actualizar
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    perfiles = [SQLITE_DEFAULTS, *db.STORAGE_PROFILES]
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'perfil':<16}{'insert/s':>12}{'update/s':>12}")
+        for perfil in perfiles:
+            ins, upd = medir(perfil, args.rows, pathlib.Path(tmp))
+            nombre = perfil if isinstance(perfil, str) else perfil["name"]
+            print(f"{nombre:<16}{ins:>12.0f}{upd:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
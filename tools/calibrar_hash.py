@@ -0,0 +1,56 @@
+"""Calibra el costo del hash de contraseñas para esta máquina.
+
+Busca los parámetros de PBKDF2 y scrypt con los que un hash tarda lo pedido,
+y muestra cuántos logins por segundo y por núcleo permite cada uno. Con
+--guardar deja el elegido en la tabla `ajustes` de bloc.db; la app lo aplica
+al arrancar.
+
+    python tools/calibrar_hash.py --objetivo-ms 250 --guardar pbkdf2_sha256
+"""
+import argparse
+import pathlib
+import sys
+import time
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import auth_service  # noqa: E402
+import hashers  # noqa: E402
+
+
+def medir(hasher, repeticiones: int) -> float:
+    guardado = hasher.encode("contrasena-de-prueba")
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        hasher.verify("contrasena-de-prueba", guardado)
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--objetivo-ms", type=float, default=250.0)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--guardar", choices=sorted(hashers.HASHERS), default=None,
+                        help="guarda este algoritmo con su costo calibrado en bloc.db")
+    args = parser.parse_args(argv)
+
+    calibrados = {}
+    for nombre in hashers.HASHERS:
+        params = calibrados[nombre] = hashers.calibrate(nombre, args.objetivo_ms)
+        hasher = type(hashers.HASHERS[nombre])(**params)
+        segundos = medir(hasher, args.repeticiones)
+        print(
+            f"{nombre:<14} {params}: {segundos * 1000:7.1f} ms por login, "
+            f"{1 / segundos:6.1f} logins/s por núcleo"
+        )
+
+    if args.guardar:
+        auth_service.guardar_hasher(args.guardar, **calibrados[args.guardar])
+        print(f"Guardado en bloc.db: {args.guardar} {calibrados[args.guardar]}")
+    else:
+        print("Usa --guardar <algoritmo> para que la app use ese costo.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""Comprueba con EXPLAIN QUERY PLAN que las consultas de tareas usan índices.
+
+Migra una base temporal a la última versión y falla (código 1) si alguna
+consulta recorre la tabla completa o necesita ordenar en un B-tree temporal.
+
+    python tools/check_query_plan.py
+"""
+import pathlib
+import sqlite3
+import sys
+import tempfile
+
+SRC_DIR = pathlib.Path(__file__).resolve().parent.parent / "src"
+sys.path.insert(0, str(SRC_DIR))
+
+import migrations  # noqa: E402
+import task_service  # noqa: E402
+
+HOY = "2025-01-01"
+
+# Las sentencias salen de task_service, así se revisa lo que de verdad se ejecuta.
+QUERIES = {
+    "listar_tareas": (task_service.SQL_LISTAR, (1,)),
+    "contar_tareas_por_seccion": (task_service.SQL_CONTAR_SECCIONES, (HOY, HOY, HOY, 1)),
+    "por_vencer": (task_service.SQL_POR_VENCER, (HOY, "2025-01-08", -1)),
+}
+_PARAMETROS_SECCION = {
+    ("past", False): (1, HOY, 50),
+    ("past", True): (1, HOY, "2024-12-01", 10, 50),
+    ("current", False): (1, HOY, 50),
+    ("current", True): (1, HOY, 10, 50),
+    ("future", False): (1, HOY, 50),
+    ("future", True): (1, HOY, "2025-02-01", 10, 50),
+    ("sin_fecha", False): (1, 50),
+    ("sin_fecha", True): (1, 10, 50),
+}
+for (parte, con_cursor), sql in task_service.SQL_SECCION.items():
+    QUERIES[f"seccion_{parte}{'_cursor' if con_cursor else ''}"] = (sql, _PARAMETROS_SECCION[parte, con_cursor])
+
+
+def problemas(con: sqlite3.Connection, sql: str, params) -> list[str]:
+    plan = [row[3] for row in con.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+    malos = [
+        detalle for detalle in plan
+        if (detalle.startswith("SCAN ") and "USING" not in detalle) or "TEMP B-TREE" in detalle
+    ]
+    return plan if malos else []
+
+
+def main() -> int:
+    fallos = 0
+    with tempfile.TemporaryDirectory() as tmp:
+        con = sqlite3.connect(pathlib.Path(tmp) / "plan.db")
+        migrations.migrate(con)
+        for nombre, (sql, params) in QUERIES.items():
+            plan = problemas(con, sql, params)
+            if plan:
+                fallos += 1
+                print(f"FALLA {nombre}: " + " | ".join(plan))
+            else:
+                print(f"ok    {nombre}")
+        con.close()
+    return 1 if fallos else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,54 @@
+"""Alta de un grupo completo desde un CSV.
+
+El CSV lleva las columnas correo/email, nombre/name y, opcionalmente,
+contrasena/password. A quien no trae contraseña se le genera una; las
+contraseñas generadas se escriben en el CSV de salida para repartirlas, así
+que --salida es obligatorio si alguna fila no trae contraseña.
+
+    python tools/provisionar_usuarios.py grupo.csv --salida credenciales.csv
+"""
+import argparse
+import csv
+import pathlib
+import sys
+import time
+
+ROOT_DIR = pathlib.Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT_DIR / "src"))
+
+import auth_service  # noqa: E402
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument("csv", type=pathlib.Path)
+    parser.add_argument("--salida", type=pathlib.Path, default=None)
+    args = parser.parse_args(argv)
+
+    auth_service.cargar_hasher_guardado()
+    filas = auth_service.leer_csv_usuarios(args.csv)
+    if not args.salida and any(not str(fila.get("contrasena") or "") for fila in filas):
+        parser.error("hay filas sin contraseña; usa --salida para guardar las que se generen")
+
+    inicio = time.perf_counter()
+    resultado = auth_service.provisionar_usuarios(filas)
+    segundos = time.perf_counter() - inicio
+
+    print(f"creados: {len(resultado['creados'])}, ya existían: {len(resultado['existentes'])}, "
+          f"inválidos: {len(resultado['invalidos'])} ({segundos:.1f} s)")
+    for numero, motivo in resultado["invalidos"]:
+        print(f"  fila {numero}: {motivo}")
+
+    generadas = [perfil for perfil in resultado["creados"] if perfil["contrasena"]]
+    if generadas:
+        with open(args.salida, "w", newline="", encoding="utf-8") as archivo:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["correo", "nombre", "contrasena"])
+            for perfil in generadas:
+                escritor.writerow([perfil["email"], perfil["name"], perfil["contrasena"]])
+        print(f"contraseñas generadas en {args.salida}")
+    auth_service.cerrar_pool_logins()
+
+
+if __name__ == "__main__":
+    main()